@@ -1,6 +1,11 @@
 import asyncio
 from logging.config import fileConfig
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
+
 from alembic import context
 from sqlalchemy import pool
 from sqlalchemy.ext.asyncio import async_engine_from_config
@@ -44,6 +49,30 @@ def get_url():
     return str(get_settings().SQLALCHEMY_DATABASE_URI)
 
 
+# Tables owned by private-assistant-commons; never migrated from this repo
+COMMONS_TABLES = frozenset(
+    {
+        "rooms",
+        "device_types",
+        "skills",
+        "global_devices",
+    }
+)
+
+
+def include_name(name, type_, parent_names):
+    """
+    Skip commons tables before they are reflected.
+
+    AIDEV-NOTE: include_object only runs after a table has been reflected. Filtering by
+    name here keeps autogenerate from inspecting the commons tables at all, so the
+    reflection pass only covers tables this repo actually migrates.
+    """
+    if type_ == "table":
+        return name not in COMMONS_TABLES
+    return True
+
+
 def include_object(object, name, type_, reflected, compare_to):
     """
     Filter out commons tables from autogenerate.
@@ -54,13 +83,7 @@ def include_object(object, name, type_, reflected, compare_to):
     """
     if type_ == "table":
         # Exclude commons tables from migration generation
-        excluded_tables = {
-            "rooms",
-            "device_types",
-            "skills",
-            "global_devices",
-        }
-        return name not in excluded_tables
+        return name not in COMMONS_TABLES
     return True
 
 
@@ -82,6 +105,7 @@ def run_migrations_offline():
         target_metadata=target_metadata,
         literal_binds=True,
         compare_type=True,
+        include_name=include_name,
         include_object=include_object,
     )
 
@@ -95,6 +119,7 @@ def do_run_migrations(connection):
         connection=connection,
         target_metadata=target_metadata,
         compare_type=True,
+        include_name=include_name,
         include_object=include_object,
     )
 
@@ -120,8 +145,20 @@ async def run_async_migrations():
 
 
 def run_migrations_online():
-    """Run migrations in 'online' mode with async support."""
-    asyncio.run(run_async_migrations())
+    """Run migrations in 'online' mode with async support.
+
+    AIDEV-NOTE: Callers that already hold a connection (e.g. a test harness running
+    many upgrades in one process) can pass it via config.attributes["connection"] to
+    skip building and disposing a fresh engine per run. The connection must be a sync
+    Connection, such as the one handed to AsyncConnection.run_sync.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    asyncio.run(run_async_migrations(), loop_factory=loop_factory)
 
 
 if context.is_offline_mode():
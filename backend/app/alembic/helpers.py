@@ -0,0 +1,54 @@
+"""Helpers for data migrations.
+
+AIDEV-NOTE: Alembic runs every migration inside one transaction. That is fine for DDL,
+but a data migration that loads and rewrites a whole table in that transaction holds
+all rows and locks until the end. paginated_update walks the table in primary key
+order and commits each batch on its own, so memory and lock time stay bounded by the
+page size instead of the table size.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+from alembic.runtime.migration import MigrationContext
+
+
+def paginated_update(table: sa.Table, *, page_size: int = 100) -> Iterator[list[Any]]:
+    """Yield batches of primary keys, committing the work done for each batch.
+
+    Batches are read with keyset pagination on the primary key, so each page is an
+    index range scan regardless of how far into the table it is. Statements issued by
+    the caller while handling a batch run inside ``autocommit_block`` and are committed
+    before the next batch is fetched.
+
+    Example:
+        >>> images = sa.table("images", sa.column("id"), sa.column("title"))
+        >>> for ids in paginated_update(images, page_size=500):
+        ...     op.execute(images.update().where(images.c.id.in_(ids)).values(title=sa.func.trim(images.c.title)))
+
+    Args:
+        table: Table to iterate; must have a single-column primary key, or a column named "id"
+        page_size: Number of primary keys per batch
+
+    Yields:
+        Primary key values of the next batch, in ascending order
+    """
+    pk_columns = list(table.primary_key.columns) or [table.c.id]
+    if len(pk_columns) != 1:
+        raise ValueError(f"paginated_update requires a single-column primary key, got {table.name}")
+    pk = pk_columns[0]
+
+    context: MigrationContext = op.get_context()
+    last_pk: Any = None
+    while True:
+        with context.autocommit_block():
+            statement = sa.select(pk).order_by(pk).limit(page_size)
+            if last_pk is not None:
+                statement = statement.where(pk > last_pk)
+            batch = list(op.get_bind().execute(statement).scalars())
+            if not batch:
+                return
+            yield batch
+        last_pk = batch[-1]
@@ -16,6 +16,14 @@ down_revision = ${repr(down_revision)}
 branch_labels = ${repr(branch_labels)}
 depends_on = ${repr(depends_on)}
 
+# Data migrations over large tables should not rewrite rows in the single migration
+# transaction. Iterate in committed batches instead:
+#
+#     from app.alembic.helpers import paginated_update
+#
+#     for ids in paginated_update(some_table, page_size=500):
+#         op.execute(some_table.update().where(some_table.c.id.in_(ids)).values(...))
+
 
 def upgrade():
     ${upgrades if upgrades else "pass"}
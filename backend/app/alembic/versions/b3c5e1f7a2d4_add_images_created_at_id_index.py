@@ -0,0 +1,45 @@
+"""add images created_at id index
+
+Revision ID: b3c5e1f7a2d4
+Revises: 7a3fe1350b39
+Create Date: 2026-10-15 09:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3c5e1f7a2d4'
+down_revision = '7a3fe1350b39'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ix_images_created_at_id'
+
+
+def upgrade():
+    # Keyset pagination of /picture-display/images/ orders by (created_at DESC, id DESC).
+    # The images table is created by the picture display skill, so skip when it is not there yet.
+    if not sa.inspect(op.get_bind()).has_table('images'):
+        return
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            'images',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name='images',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -1,28 +1,83 @@
+import asyncio
+import hashlib
 import logging
+import uuid
+import weakref
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from http import HTTPStatus
 from typing import Annotated, Any
 
 import httpx
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from joserfc.errors import JoseError
 from pydantic import ValidationError
-from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app import crud
 from app.core import security
 from app.core.config import get_settings
-from app.core.db import get_engine
+from app.core.db import get_session_factory
 from app.models import TokenPayload, User
 
 logger = logging.getLogger(__name__)
 
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl=f"{get_settings().API_V1_STR}/login/access-token")
 
+# Maps OAuth subject -> user id so known OAuth users are resolved with a primary key lookup.
+_oauth_user_cache: TTLCache[str, uuid.UUID] = TTLCache(maxsize=5000, ttl=60)
+
+# Userinfo responses keyed by access token hash; the per-key locks make concurrent cold lookups
+# for the same token share a single upstream request.
+_userinfo_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(maxsize=1000, ttl=30)
+_userinfo_locks: weakref.WeakValueDictionary[bytes, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+@lru_cache(maxsize=1)
+def get_userinfo_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for IdP userinfo requests (lazy singleton).
+
+    Reusing one client keeps connections and TLS sessions to the IdP alive across logins.
+    """
+    return httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+
+
+async def close_userinfo_client() -> None:
+    """Close the shared userinfo client if it was created."""
+    if get_userinfo_client.cache_info().currsize:
+        await get_userinfo_client().aclose()
+        get_userinfo_client.cache_clear()
+
+
+async def _fetch_userinfo(userinfo_url: str, token: str) -> dict[str, Any] | None:
+    """Fetch userinfo claims for an access token, reusing recent responses for the same token."""
+    key = hashlib.sha256(token.encode()).digest()
+    lock = _userinfo_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = _userinfo_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await get_userinfo_client().get(
+            userinfo_url,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        if response.status_code != HTTPStatus.OK:
+            logger.warning("Failed to fetch userinfo: %s", response.status_code)
+            return None
+
+        userinfo: dict[str, Any] = response.json()
+        _userinfo_cache[key] = userinfo
+        return userinfo
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSession(get_engine()) as session:
+    async with get_session_factory()() as session:
         yield session
 
 
@@ -32,12 +87,13 @@ TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 async def get_current_user(session: SessionDep, token: TokenDep) -> User:
     """Get current user from JWT token (local or OAuth)."""
-    logger.debug(f"Validating token (length={len(token)}, dots={token.count('.')})")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Validating token (length=%s, dots=%s)", len(token), token.count("."))
     try:
         payload, token_type = await security.validate_token(token)
-        logger.debug(f"Token validated as type: {token_type}")
+        logger.debug("Token validated as type: %s", token_type)
     except (ValidationError, ValueError, JoseError) as e:
-        logger.error(f"Token validation failed: {type(e).__name__}: {e!s}")
+        logger.error("Token validation failed: %s: %s", type(e).__name__, e)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Could not validate credentials: {e!s}",
@@ -72,12 +128,18 @@ async def _get_or_create_oauth_user(session: AsyncSession, oauth_payload: dict[s
     if not oauth_subject:
         raise HTTPException(status_code=400, detail="Invalid OAuth token: missing sub claim")
 
+    # Known subject: primary key lookup instead of filtering on oauth_subject
+    cached_user_id = _oauth_user_cache.get(oauth_subject)
+    if cached_user_id is not None:
+        user = await session.get(User, cached_user_id)
+        if user:
+            return user
+
     # Look up by oauth_subject first (existing user)
-    statement = select(User).where(User.oauth_subject == oauth_subject)
-    result = await session.exec(statement)
-    user = result.first()
+    user = await crud.get_user_by_oauth_subject(session=session, oauth_subject=oauth_subject)
 
     if user:
+        _oauth_user_cache[oauth_subject] = user.id
         return user
 
     # New user - need email for provisioning
@@ -88,22 +150,14 @@ async def _get_or_create_oauth_user(session: AsyncSession, oauth_payload: dict[s
     if not email and settings.oauth.ISSUER:
         userinfo_url = f"{settings.oauth.ISSUER}/oidc/v1/userinfo"
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    userinfo_url,
-                    headers={"Authorization": f"Bearer {token}"},
-                    timeout=10.0,
-                )
-                if response.status_code == HTTPStatus.OK:
-                    userinfo = response.json()
-                    email = userinfo.get("email")
-                    if not full_name:
-                        full_name = userinfo.get("name")
-                    logger.info(f"Fetched userinfo for sub={oauth_subject}: email={email}")
-                else:
-                    logger.warning(f"Failed to fetch userinfo: {response.status_code}")
+            userinfo = await _fetch_userinfo(userinfo_url, token)
+            if userinfo:
+                email = userinfo.get("email")
+                if not full_name:
+                    full_name = userinfo.get("name")
+                logger.info("Fetched userinfo for sub=%s: email=%s", oauth_subject, email)
         except Exception as e:
-            logger.warning(f"Error fetching userinfo: {e}")
+            logger.warning("Error fetching userinfo: %s", e)
 
     if not email:
         raise HTTPException(
@@ -111,11 +165,7 @@ async def _get_or_create_oauth_user(session: AsyncSession, oauth_payload: dict[s
             detail="Could not determine email for OAuth user. Ensure 'email' scope is requested.",
         )
 
-    # Extract provider name from issuer
-    provider = "oauth"
-    if settings.oauth.ISSUER:
-        issuer_parts = settings.oauth.ISSUER.rstrip("/").split("//")[-1].split("/")[0]
-        provider = issuer_parts.replace("www.", "")
+    provider = settings.oauth_provider_name or "oauth"
 
     new_user = User(
         email=email,
@@ -129,16 +179,25 @@ async def _get_or_create_oauth_user(session: AsyncSession, oauth_payload: dict[s
 
     session.add(new_user)
     await session.commit()
-    await session.refresh(new_user)
-    logger.info(f"Auto-provisioned new OAuth user: {email} (provider={provider})")
+    _oauth_user_cache[oauth_subject] = new_user.id
+    logger.info("Auto-provisioned new OAuth user: %s (provider=%s)", email, provider)
 
     return new_user
 
 
+def invalidate_oauth_user_cache(oauth_subject: str | None) -> None:
+    """Drop the cached user id for an OAuth subject, e.g. after the user was deleted."""
+    if oauth_subject:
+        _oauth_user_cache.pop(oauth_subject, None)
+
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
-def get_current_active_superuser(current_user: CurrentUser) -> User:
+async def get_current_active_superuser(current_user: CurrentUser) -> User:
+    # AIDEV-NOTE: async so FastAPI runs this inline instead of dispatching to the threadpool.
+    # get_current_user is resolved once per request and shared, so this check adds no DB work;
+    # User objects are deliberately not cached across requests to keep is_superuser/is_active fresh.
     if not current_user.is_superuser:
         raise HTTPException(status_code=403, detail="The user doesn't have enough privileges")
     return current_user
@@ -0,0 +1,142 @@
+"""Shared helpers for paginated list endpoints."""
+
+import base64
+import json
+import uuid
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
+
+
+async def fetch_page[T](
+    session: AsyncSession,
+    statement: SelectOfScalar[T],
+    *,
+    skip: int,
+    limit: int,
+) -> tuple[list[T], int]:
+    """Fetch one page of rows together with the total row count.
+
+    AIDEV-NOTE: The total is read from a COUNT(*) OVER () window column on the page query,
+    so a list request costs one round trip. A separate count is only issued when the page
+    is empty because skip points past the end of the table or limit is not positive.
+
+    Args:
+        session: Database session
+        statement: Base select including filters and ordering, without offset/limit
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+
+    Returns:
+        Page rows and the total number of rows matching the statement
+    """
+    page_statement = statement.add_columns(func.count().over().label("total")).offset(skip).limit(limit)
+    result: Any = await session.exec(page_statement)  # type: ignore[call-overload]
+    rows = result.all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    if skip == 0 and limit > 0:
+        # An empty first page means an empty result; with limit=0 it says nothing about the total
+        return [], 0
+
+    count_statement = select(func.count()).select_from(statement.order_by(None).subquery())
+    count_result = await session.exec(count_statement)
+    return [], count_result.one()
+
+
+async def fetch_page_without_count[T](
+    session: AsyncSession,
+    statement: SelectOfScalar[T],
+    *,
+    skip: int,
+    limit: int,
+) -> tuple[list[T], bool]:
+    """Fetch one page of rows and whether more rows follow, without counting the total.
+
+    One extra row is requested; it only signals that another page exists and is dropped.
+    A non-positive limit returns an empty page with has_more=False, so clients that page on
+    has_more cannot loop on it.
+
+    Args:
+        session: Database session
+        statement: Base select including filters and ordering, without offset/limit
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+
+    Returns:
+        Page rows and whether rows exist beyond this page
+    """
+    if limit <= 0:
+        return [], False
+    result = await session.exec(statement.offset(skip).limit(limit + 1))
+    rows = list(result.all())
+    return rows[:limit], len(rows) > limit
+
+
+async def fetch_list_page[T](
+    session: AsyncSession,
+    statement: SelectOfScalar[T],
+    *,
+    skip: int,
+    limit: int,
+    with_count: bool = True,
+) -> tuple[list[T], int | None, bool]:
+    """Fetch one page for a list endpoint, counting the total only when asked to.
+
+    AIDEV-NOTE: COUNT(*) is the expensive half of offset pagination on large tables, so
+    list endpoints expose with_count=false to skip it and rely on has_more instead.
+
+    Returns:
+        Page rows, the total (None when not counted) and whether rows exist beyond this page
+    """
+    if not with_count:
+        rows, has_more = await fetch_page_without_count(session, statement, skip=skip, limit=limit)
+        return rows, None, has_more
+    rows, count = await fetch_page(session, statement, skip=skip, limit=limit)
+    return rows, count, limit > 0 and skip + len(rows) < count
+
+
+def construct_public[M: BaseModel](model: type[M], rows: Iterable[object]) -> list[M]:
+    """Build public response models from ORM rows without validating them.
+
+    AIDEV-NOTE: Rows loaded from the database are already typed and constrained, so running
+    every field through Pydantic validation again is pure overhead on list endpoints. Fields
+    the row does not have (e.g. ImagePublic.url) are set to None.
+
+    Args:
+        model: Public response model to build
+        rows: ORM objects exposing the model's fields as attributes
+
+    Returns:
+        One model instance per row
+    """
+    fields = tuple(model.model_fields)
+    return [model.model_construct(**{field: getattr(row, field, None) for field in fields}) for row in rows]
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Encode a (created_at, id) keyset position as an opaque URL-safe cursor."""
+    raw = json.dumps({"created_at": created_at.isoformat(), "id": str(row_id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at, row_id = datetime.fromisoformat(data["created_at"]), uuid.UUID(data["id"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+    # created_at columns are naive UTC; comparing them with an aware value fails in the driver
+    if created_at.tzinfo is not None:
+        raise ValueError("Invalid cursor")
+    return created_at, row_id
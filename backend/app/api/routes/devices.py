@@ -4,11 +4,15 @@ import logging
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 from private_assistant_commons.database.models import DeviceType, GlobalDevice, Room, Skill
-from sqlmodel import func, select
+from sqlalchemy import bindparam, delete, exists
+from sqlalchemy import select as sa_select
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import CurrentUser, SessionDep
+from app.api.pagination import construct_public, fetch_page
 from app.core.mqtt import publish_device_update
 from app.models import Message
 from app.models_commons_api import (
@@ -21,61 +25,84 @@ from app.models_commons_api import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/devices", tags=["devices"])
 
+# AIDEV-NOTE: Hot lookups reuse one statement object built at import time, so SQLAlchemy's
+# compiled cache and asyncpg's prepared statement cache always see identical SQL.
+_DEVICE_BY_ID_STMT = select(GlobalDevice).where(col(GlobalDevice.id) == bindparam("device_id"))
+
+
+async def _validate_references(
+    session: AsyncSession,
+    *,
+    device_type_id: uuid.UUID | None = None,
+    skill_id: uuid.UUID | None = None,
+    room_id: uuid.UUID | None = None,
+) -> None:
+    """Check that referenced device type, skill and room exist, using a single query.
+
+    Only references that are not None are checked.
+
+    Raises:
+        HTTPException: 400 for the first reference that does not exist
+    """
+    references = [
+        (col(DeviceType.id), device_type_id, "Device type not found"),
+        (col(Skill.id), skill_id, "Skill not found"),
+        (col(Room.id), room_id, "Room not found"),
+    ]
+    checks = [(id_column, ref_id, detail) for id_column, ref_id, detail in references if ref_id is not None]
+    if not checks:
+        return
+
+    statement = sa_select(*(exists().where(id_column == ref_id) for id_column, ref_id, _ in checks))
+    result = await session.exec(statement)  # type: ignore[call-overload]
+    for found, (_, _, detail) in zip(result.one(), checks, strict=True):
+        if not found:
+            raise HTTPException(status_code=400, detail=detail)
+
 
 @router.get("/", response_model=GlobalDevicesPublic)
 async def read_devices(session: SessionDep, _current_user: CurrentUser, skip: int = 0, limit: int = 100) -> Any:
     """Retrieve global devices with pagination."""
-    count_statement = select(func.count()).select_from(GlobalDevice)
-    result = await session.exec(count_statement)
-    count = result.one()
-
-    statement = select(GlobalDevice).offset(skip).limit(limit)
-    result = await session.exec(statement)  # type: ignore[arg-type]
-    devices = result.all()
-
-    return GlobalDevicesPublic(data=list(devices), count=count)  # type: ignore[arg-type]
+    # AIDEV-NOTE: GlobalDevicePublic only exposes FK ids, so device_type/room/skill relationships are
+    # never touched during serialization. Add selectinload() options here if nested objects are exposed.
+    devices, count = await fetch_page(session, select(GlobalDevice), skip=skip, limit=limit)
+    return GlobalDevicesPublic(data=construct_public(GlobalDevicePublic, devices), count=count)
 
 
 @router.get("/{device_id}", response_model=GlobalDevicePublic)
 async def read_device(session: SessionDep, _current_user: CurrentUser, device_id: uuid.UUID) -> Any:
     """Get device by ID."""
-    device = await session.get(GlobalDevice, device_id)
+    result = await session.exec(_DEVICE_BY_ID_STMT, params={"device_id": device_id})
+    device = result.first()
     if not device:
         raise HTTPException(status_code=404, detail="Device not found")
     return device
 
 
 @router.post("/", response_model=GlobalDevicePublic)
-async def create_device(*, session: SessionDep, _current_user: CurrentUser, device_in: GlobalDeviceCreate) -> Any:
+async def create_device(
+    *,
+    session: SessionDep,
+    _current_user: CurrentUser,
+    device_in: GlobalDeviceCreate,
+    background_tasks: BackgroundTasks,
+) -> Any:
     """Create new global device."""
-    # Validate device_type_id exists
-    device_type = await session.get(DeviceType, device_in.device_type_id)
-    if not device_type:
-        raise HTTPException(status_code=400, detail="Device type not found")
-
-    # Validate skill_id exists
-    skill = await session.get(Skill, device_in.skill_id)
-    if not skill:
-        raise HTTPException(status_code=400, detail="Skill not found")
-
-    # Validate room_id if provided
-    if device_in.room_id:
-        room = await session.get(Room, device_in.room_id)
-        if not room:
-            raise HTTPException(status_code=400, detail="Room not found")
+    # Validate referenced device type, skill and (optional) room in one round trip
+    await _validate_references(
+        session,
+        device_type_id=device_in.device_type_id,
+        skill_id=device_in.skill_id,
+        room_id=device_in.room_id,
+    )
 
     # Create device
     device = GlobalDevice.model_validate(device_in)
     session.add(device)
     await session.commit()
-    await session.refresh(device)
 
-    # Publish MQTT notification
-    try:
-        await publish_device_update(str(device.id), "created")
-    except Exception as e:
-        logger.error(f"Failed to publish MQTT event for device creation: {e}")
-        # Don't fail the request if MQTT fails
+    # Publish MQTT notification after the response is sent
+    background_tasks.add_task(publish_device_update, str(device.id), "created")
 
     return device
 
@@ -87,67 +114,58 @@ async def update_device(
     _current_user: CurrentUser,
     device_id: uuid.UUID,
     device_in: GlobalDeviceUpdate,
+    background_tasks: BackgroundTasks,
 ) -> Any:
     """Update a global device."""
-    device = await session.get(GlobalDevice, device_id)
+    result = await session.exec(_DEVICE_BY_ID_STMT, params={"device_id": device_id})
+    device = result.first()
     if not device:
         raise HTTPException(status_code=404, detail="Device not found")
 
     # Extract update data
     update_dict = device_in.model_dump(exclude_unset=True)
 
-    # Validate device_type_id if being updated
-    if "device_type_id" in update_dict:
-        device_type = await session.get(DeviceType, update_dict["device_type_id"])
-        if not device_type:
-            raise HTTPException(status_code=400, detail="Device type not found")
-
-    # Validate skill_id if being updated
-    if "skill_id" in update_dict:
-        skill = await session.get(Skill, update_dict["skill_id"])
-        if not skill:
-            raise HTTPException(status_code=400, detail="Skill not found")
-
-    # Validate room_id if being updated
-    if "room_id" in update_dict and update_dict["room_id"] is not None:
-        room = await session.get(Room, update_dict["room_id"])
-        if not room:
-            raise HTTPException(status_code=400, detail="Room not found")
-
-    # Update device
+    # device_type_id and skill_id are required, so an explicit null can never reference a row
+    if "device_type_id" in update_dict and update_dict["device_type_id"] is None:
+        raise HTTPException(status_code=400, detail="Device type not found")
+    if "skill_id" in update_dict and update_dict["skill_id"] is None:
+        raise HTTPException(status_code=400, detail="Skill not found")
+
+    # Validate the references being updated in one round trip (room_id may be cleared with null)
+    await _validate_references(
+        session,
+        device_type_id=update_dict.get("device_type_id"),
+        skill_id=update_dict.get("skill_id"),
+        room_id=update_dict.get("room_id"),
+    )
+
+    # Update device (already tracked by the session, and all columns are loaded after commit)
     device.sqlmodel_update(update_dict)
-    session.add(device)
     await session.commit()
-    await session.refresh(device)
 
-    # Publish MQTT notification
-    try:
-        await publish_device_update(str(device.id), "updated")
-    except Exception as e:
-        logger.error(f"Failed to publish MQTT event for device update: {e}")
-        # Don't fail the request if MQTT fails
+    # Publish MQTT notification after the response is sent
+    background_tasks.add_task(publish_device_update, str(device.id), "updated")
 
     return device
 
 
 @router.delete("/{device_id}")
-async def delete_device(session: SessionDep, _current_user: CurrentUser, device_id: uuid.UUID) -> Message:
+async def delete_device(
+    session: SessionDep,
+    _current_user: CurrentUser,
+    device_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
+) -> Message:
     """Delete a global device."""
-    device = await session.get(GlobalDevice, device_id)
-    if not device:
+    # Single DELETE ... RETURNING: an empty result means the device did not exist
+    statement = delete(GlobalDevice).where(col(GlobalDevice.id) == device_id).returning(col(GlobalDevice.id))
+    result = await session.exec(statement)
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Device not found")
 
-    # Store device_id as string before deletion
-    device_id_str = str(device.id)
-
-    await session.delete(device)
     await session.commit()
 
-    # Publish MQTT notification
-    try:
-        await publish_device_update(device_id_str, "deleted")
-    except Exception as e:
-        logger.error(f"Failed to publish MQTT event for device deletion: {e}")
-        # Don't fail the request if MQTT fails
+    # Publish MQTT notification after the response is sent
+    background_tasks.add_task(publish_device_update, str(device_id), "deleted")
 
     return Message(message="Device deleted successfully")
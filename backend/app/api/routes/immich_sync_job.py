@@ -1,19 +1,20 @@
 """API routes for ImmichSyncJob management."""
 
 import logging
+import re
 import uuid
-from datetime import datetime
-from typing import Any
 
 from fastapi import APIRouter, HTTPException
 from private_assistant_picture_display_skill.models.immich_sync_job import (
     ImmichSyncJob,
     SyncStrategy,
 )
+from sqlalchemy import delete
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import col, func, select
 
 from app.api.deps import CurrentUser, SessionDep
+from app.api.pagination import construct_public, fetch_page
 from app.api.schemas.immich_sync_job import (
     ImmichSyncJobCreate,
     ImmichSyncJobPublic,
@@ -25,13 +26,16 @@ from app.models import Message
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/immich-sync-jobs", tags=["immich-sync-jobs"])
 
+# Classifies constraint violations by the wording of the database error
+_INTEGRITY_ERROR_RE = re.compile(r"(?P<unique>unique|duplicate)|(?P<foreign_key>foreign key|fk_)", re.IGNORECASE)
+
 
 def _handle_integrity_error(e: IntegrityError) -> None:
     """Convert database IntegrityError to appropriate HTTPException."""
-    error_msg = str(e.orig).lower() if e.orig else str(e).lower()
-    if "unique" in error_msg or "duplicate" in error_msg:
+    match = _INTEGRITY_ERROR_RE.search(str(e.orig) if e.orig else str(e))
+    if match and match["unique"]:
         raise HTTPException(status_code=400, detail="A sync job with this name already exists")
-    if "foreign key" in error_msg or "fk_" in error_msg:
+    if match and match["foreign_key"]:
         raise HTTPException(status_code=400, detail="Target device not found")
     raise HTTPException(status_code=400, detail="Database constraint violation")
 
@@ -54,19 +58,14 @@ async def read_sync_jobs(
     Returns:
         Paginated list of sync jobs
     """
-    # Count total
-    count_statement = select(func.count()).select_from(ImmichSyncJob)
-    count_result = await session.exec(count_statement)
-    count = count_result.one()
-
-    # Get paginated results ordered by name
+    # Get paginated results ordered by name, with the total count in the same query
     # AIDEV-NOTE: Using col() for proper mypy typing with SQLModel
-    statement = select(ImmichSyncJob).order_by(col(ImmichSyncJob.name)).offset(skip).limit(limit)
-    result: Any = await session.exec(statement)
-    jobs = list(result.all())
+    statement = select(ImmichSyncJob).order_by(col(ImmichSyncJob.name))
+    jobs, count = await fetch_page(session, statement, skip=skip, limit=limit)
 
     return ImmichSyncJobsPublic(
-        data=[ImmichSyncJobPublic.model_validate(job) for job in jobs],
+        # Rows come from the database, so skip per-row validation
+        data=construct_public(ImmichSyncJobPublic, jobs),
         count=count,
     )
 
@@ -123,7 +122,6 @@ async def create_sync_job(
     except IntegrityError as e:
         await session.rollback()
         _handle_integrity_error(e)
-    await session.refresh(job)
     return job
 
 
@@ -162,7 +160,8 @@ async def update_sync_job(
         raise HTTPException(status_code=400, detail="Query is required when strategy is SMART")
 
     job.sqlmodel_update(update_dict)
-    job.updated_at = datetime.now()
+    # Let the database stamp the update; the refresh below loads the stored value
+    job.updated_at = func.now()  # type: ignore[assignment]
 
     session.add(job)
     try:
@@ -193,11 +192,12 @@ async def delete_sync_job(
     Raises:
         HTTPException: If sync job not found
     """
-    job = await session.get(ImmichSyncJob, job_id)
-    if not job:
+    # Single DELETE ... RETURNING: an empty result means the job did not exist
+    statement = delete(ImmichSyncJob).where(col(ImmichSyncJob.id) == job_id).returning(col(ImmichSyncJob.id))
+    result = await session.exec(statement)
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Sync job not found")
 
-    await session.delete(job)
     await session.commit()
 
     return Message(message="Sync job deleted successfully")
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from sqlmodel import select
 
 from app.api.deps import CurrentUser, SessionDep
+from app.api.pagination import construct_public, fetch_page
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/monitoring", tags=["monitoring"])
@@ -32,21 +33,13 @@ class SkillsPublic(BaseModel):
 
 
 @router.get("/skills", response_model=SkillsPublic)
-async def read_skills(session: SessionDep, _current_user: CurrentUser) -> SkillsPublic:
-    """List all registered skills."""
-    statement = select(Skill).order_by(Skill.name)
-    result = await session.exec(statement)
-    skills = result.all()
-
-    # Convert to public schema
-    skills_public = [
-        SkillPublic(
-            id=skill.id,
-            name=skill.name,
-            created_at=skill.created_at,
-            updated_at=skill.updated_at,
-        )
-        for skill in skills
-    ]
-
-    return SkillsPublic(data=skills_public, count=len(skills_public))
+async def read_skills(
+    session: SessionDep,
+    _current_user: CurrentUser,
+    skip: int = 0,
+    limit: int = 100,
+) -> SkillsPublic:
+    """List registered skills with pagination."""
+    skills, count = await fetch_page(session, select(Skill).order_by(Skill.name), skip=skip, limit=limit)
+    # Rows come from the database, so skip per-row validation
+    return SkillsPublic(data=construct_public(SkillPublic, skills), count=count)
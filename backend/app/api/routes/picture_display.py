@@ -1,18 +1,29 @@
 """Picture display API endpoints for image management with MinIO storage."""
 
+import hashlib
 import logging
+import os
+import time
 import uuid
-from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+import orjson
+from cachetools import TLRUCache
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, Request, Response, UploadFile
 from private_assistant_picture_display_skill.models.image import Image
 from pydantic import BaseModel
-from sqlalchemy import desc
+from sqlalchemy import bindparam, delete, desc, tuple_, update
 from sqlmodel import col, func, select
 
 from app.api.deps import CurrentUser, SessionDep
-from app.api.schemas.picture_display import ImagePublic, ImagesPublic, ImageUpdate
+from app.api.pagination import (
+    construct_public,
+    decode_cursor,
+    encode_cursor,
+    fetch_list_page,
+    fetch_page_without_count,
+)
+from app.api.schemas.picture_display import ImagePublic, ImagesPublic, ImageUpdate, ImageUploadForm
 from app.core.minio_client import MinIOClient
 from app.models import Message
 
@@ -20,6 +31,139 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/picture-display", tags=["picture-display"])
 
 
+# AIDEV-NOTE: Statements are built once at import time and only extended per request, so
+# SQLAlchemy's compiled cache and asyncpg's prepared statements always see identical SQL.
+# Using col() for proper mypy typing with SQLModel. The (created_at, id) order matches
+# ix_images_created_at_id, so cursor pages are an index seek at any depth.
+_IMAGES_LIST_STMT = select(Image).order_by(desc(col(Image.created_at)), desc(col(Image.id)))
+_IMAGES_COUNT_STMT = select(func.count()).select_from(Image)
+_IMAGE_BY_ID_STMT = select(Image).where(col(Image.id) == bindparam("image_id"))
+
+# How long clients may use cached image metadata before revalidating with If-None-Match
+IMAGE_METADATA_MAX_AGE_SECONDS = 60
+
+# Presigned URLs are reused for this fraction of their lifetime, so a cached URL always has
+# at least 20% of its validity left when handed out.
+PRESIGNED_URL_REUSE_FRACTION = 0.8
+
+PresignedUrlKey = tuple[str, int]
+PresignedUrlEntry = tuple[str, float]
+
+
+def _presigned_url_expiry(key: PresignedUrlKey, _value: PresignedUrlEntry, now: float) -> float:
+    """Drop a cached URL once the reuse fraction of its lifetime has passed."""
+    _, expires_hours = key
+    return now + expires_hours * 3600 * PRESIGNED_URL_REUSE_FRACTION
+
+
+# AIDEV-NOTE: Keyed by (storage_path, expires_hours); values are (url, absolute expiry). Two
+# concurrent misses for the same key may both sign; either URL is valid, so no lock is taken.
+_presigned_url_cache: TLRUCache[PresignedUrlKey, PresignedUrlEntry] = TLRUCache(
+    maxsize=10_000, ttu=_presigned_url_expiry, timer=time.time
+)
+
+
+async def _get_presigned_url(storage_path: str, expires_hours: int) -> tuple[str, int]:
+    """Get a presigned URL for an image, reusing a recently signed one.
+
+    Returns:
+        The URL and the number of seconds it remains valid
+    """
+    key = (storage_path, expires_hours)
+    cached = _presigned_url_cache.get(key)
+    if cached is None:
+        url = await MinIOClient.get_presigned_url(storage_path, expires_hours)
+        cached = (url, time.time() + expires_hours * 3600)
+        _presigned_url_cache[key] = cached
+    url, expires_at = cached
+    return url, int(expires_at - time.time())
+
+
+async def _get_presigned_urls(storage_paths: list[str], expires_hours: int) -> list[str]:
+    """Get presigned URLs for several images, signing all cache misses in one batch.
+
+    Returns:
+        URLs in the order of storage_paths
+    """
+    urls: dict[str, str] = {}
+    for storage_path in storage_paths:
+        cached = _presigned_url_cache.get((storage_path, expires_hours))
+        if cached is not None:
+            urls[storage_path] = cached[0]
+
+    misses = [storage_path for storage_path in dict.fromkeys(storage_paths) if storage_path not in urls]
+    if misses:
+        signed = await MinIOClient.get_presigned_urls(misses, expires_hours)
+        expires_at = time.time() + expires_hours * 3600
+        for storage_path, url in zip(misses, signed, strict=True):
+            _presigned_url_cache[(storage_path, expires_hours)] = (url, expires_at)
+            urls[storage_path] = url
+
+    return [urls[storage_path] for storage_path in storage_paths]
+
+
+def _invalidate_presigned_urls(storage_path: str) -> None:
+    """Forget cached URLs for a deleted image."""
+    for key in [key for key in _presigned_url_cache if key[0] == storage_path]:
+        _presigned_url_cache.pop(key, None)
+
+
+# Number of leading bytes needed to recognise every format in _IMAGE_SIGNATURES
+IMAGE_SNIFF_BYTES = 16
+
+# MIME type and the (offset, magic bytes) pairs that must all match
+_IMAGE_SIGNATURES: tuple[tuple[str, tuple[tuple[int, bytes], ...]], ...] = (
+    ("image/jpeg", ((0, b"\xff\xd8\xff"),)),
+    ("image/png", ((0, b"\x89PNG\r\n\x1a\n"),)),
+    ("image/gif", ((0, b"GIF87a"),)),
+    ("image/gif", ((0, b"GIF89a"),)),
+    ("image/webp", ((0, b"RIFF"), (8, b"WEBP"))),
+    ("image/heic", ((4, b"ftypheic"),)),
+    ("image/heic", ((4, b"ftypheix"),)),
+    ("image/heic", ((4, b"ftypmif1"),)),
+    ("image/avif", ((4, b"ftypavif"),)),
+    ("image/tiff", ((0, b"II*\x00"),)),
+    ("image/tiff", ((0, b"MM\x00*"),)),
+    ("image/bmp", ((0, b"BM"),)),
+)
+
+
+def _sniff_image_type(head: bytes) -> str | None:
+    """Detect an image MIME type from the file's magic bytes.
+
+    Returns:
+        MIME type of a supported image format, or None if the bytes match none
+    """
+    for mime_type, parts in _IMAGE_SIGNATURES:
+        if all(head.startswith(magic, offset) for offset, magic in parts):
+            return mime_type
+    return None
+
+
+async def _delete_image_object(storage_path: str) -> None:
+    """Remove an image object from MinIO after its record is gone, logging instead of raising."""
+    try:
+        await MinIOClient.delete_image(storage_path)
+    except Exception as e:
+        logger.warning("MinIO deletion failed, object left orphaned: %s", e)
+
+
+async def get_image_or_404(session: SessionDep, image_id: uuid.UUID) -> Image:
+    """Load the image addressed by the image_id path parameter.
+
+    Raises:
+        HTTPException: If image not found
+    """
+    result = await session.exec(_IMAGE_BY_ID_STMT, params={"image_id": image_id})
+    image = result.first()
+    if not image:
+        raise HTTPException(status_code=404, detail="Image not found")
+    return image
+
+
+GetImage = Annotated[Image, Depends(get_image_or_404)]
+
+
 class PresignedUrlResponse(BaseModel):
     """Response model for presigned URL."""
 
@@ -28,16 +172,12 @@ class PresignedUrlResponse(BaseModel):
 
 
 @router.post("/images/upload", response_model=ImagePublic)
-async def upload_image(  # noqa: PLR0913 - form fields require separate parameters
+async def upload_image(
     *,
     session: SessionDep,
     _current_user: CurrentUser,
-    file: UploadFile = File(...),  # noqa: B008
-    title: str | None = Form(None),
-    description: str | None = Form(None),
-    tags: str | None = Form(None),
-    display_duration_seconds: int = Form(3600),
-    priority: int = Form(0),
+    file: Annotated[UploadFile, File()],
+    form: Annotated[ImageUploadForm, Depends()],
 ) -> Image:
     """Upload image to MinIO and create database record.
 
@@ -45,11 +185,7 @@ async def upload_image(  # noqa: PLR0913 - form fields require separate paramete
         session: Database session
         current_user: Authenticated user
         file: Image file to upload
-        title: Optional image title
-        description: Optional image description
-        tags: Optional comma-separated tags
-        display_duration_seconds: Display duration (default 3600 seconds)
-        priority: Display priority (default 0)
+        form: Title, description, tags, display duration (default 3600 seconds) and priority (default 0)
 
     Returns:
         Created image record
@@ -57,110 +193,160 @@ async def upload_image(  # noqa: PLR0913 - form fields require separate paramete
     Raises:
         HTTPException: If file validation fails or upload fails
     """
-    # Validate file type
-    if not file.content_type or not file.content_type.startswith("image/"):
+    # Validate file type from the leading bytes; the client-supplied content type is not trusted
+    content_type = _sniff_image_type(file.file.read(IMAGE_SNIFF_BYTES))
+    file.file.seek(0)
+    if content_type is None:
         raise HTTPException(status_code=400, detail="File must be an image")
 
-    # Read and validate file size (max 10MB)
-    file_data = await file.read()
+    # Validate file size (max 10MB) without reading the spooled upload into memory
+    size = file.size
+    if size is None:
+        size = file.file.seek(0, os.SEEK_END)
+        file.file.seek(0)
     max_size = 10 * 1024 * 1024
-    if len(file_data) > max_size:
+    if size > max_size:
         raise HTTPException(status_code=413, detail="File too large (max 10MB)")
 
-    # Upload to MinIO
+    # Stream the upload to MinIO
     try:
-        storage_path = MinIOClient.upload_image(file_data, file.filename or "uploaded.jpg", file.content_type)
+        storage_path = await MinIOClient.upload_image(file.file, size, file.filename or "uploaded.jpg", content_type)
     except Exception as e:
-        logger.error(f"MinIO upload failed: {e}")
+        logger.error("MinIO upload failed: %s", e)
         raise HTTPException(status_code=500, detail="Image upload failed") from e
 
     # Create DB record using skill's Image model
     image = Image(
         source_name="manual upload",
         storage_path=storage_path,
-        title=title,
-        description=description,
-        tags=tags,
-        display_duration_seconds=display_duration_seconds,
-        priority=priority,
+        title=form.title,
+        description=form.description,
+        tags=form.tags,
+        display_duration_seconds=form.display_duration_seconds,
+        priority=form.priority,
     )
     session.add(image)
     await session.commit()
-    await session.refresh(image)
 
     return image
 
 
 @router.get("/images/", response_model=ImagesPublic)
-async def read_images(
+async def read_images(  # noqa: PLR0913 - query parameters require separate parameters
     session: SessionDep,
     _current_user: CurrentUser,
-    skip: int = 0,
+    skip: Annotated[int, Query(deprecated=True)] = 0,
     limit: int = 100,
+    cursor: str | None = None,
+    with_count: bool = True,
+    include_urls: bool = False,
 ) -> ImagesPublic:
-    """Retrieve images with pagination.
+    """Retrieve images, newest first, with keyset or offset pagination.
 
     Args:
         session: Database session
         current_user: Authenticated user
-        skip: Number of records to skip
+        skip: Number of records to skip (deprecated, use cursor)
         limit: Maximum number of records to return
+        cursor: next_cursor from the previous page; takes precedence over skip
+        with_count: Whether to count all images; when false, count is None
+        include_urls: Whether to add a presigned URL (valid for 1 hour) to every image
 
     Returns:
-        Paginated list of images
-    """
-    # Count total
-    count_statement = select(func.count()).select_from(Image)
-    count_result = await session.exec(count_statement)
-    count = count_result.one()
+        Paginated list of images with the cursor of the next page, if any
 
-    # Get paginated results
-    # AIDEV-NOTE: Using col() for proper mypy typing with SQLModel
-    statement = select(Image).order_by(desc(col(Image.created_at))).offset(skip).limit(limit)
-    images_result: Any = await session.exec(statement)
-    images = list(images_result.all())
+    Raises:
+        HTTPException: If the cursor is malformed or URL generation fails
+    """
+    statement = _IMAGES_LIST_STMT
+
+    count: int | None = None
+    if cursor is None:
+        # Offset pagination; when counted, the total comes from the same query
+        images, count, has_more = await fetch_list_page(
+            session, statement, skip=skip, limit=limit, with_count=with_count
+        )
+    else:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+        statement = statement.where(tuple_(col(Image.created_at), col(Image.id)) < (cursor_created_at, cursor_id))
+        images, has_more = await fetch_page_without_count(session, statement, skip=0, limit=limit)
+        if with_count:
+            # The total is taken over the whole table, not just the rows after the cursor
+            count_result = await session.exec(_IMAGES_COUNT_STMT)
+            count = count_result.one()
+
+    # Never index into an empty page, whatever has_more says
+    next_cursor = encode_cursor(images[-1].created_at, images[-1].id) if has_more and images else None
 
     # Convert ORM models to Pydantic response models
+    # Rows come from the database, so skip per-row validation
+    data = construct_public(ImagePublic, images)
+    if include_urls:
+        # Saves clients one /url request per image when rendering a gallery
+        try:
+            urls = await _get_presigned_urls([img.storage_path for img in images], expires_hours=1)
+        except Exception as e:
+            logger.error("Failed to generate presigned URLs: %s", e)
+            raise HTTPException(status_code=500, detail="Failed to generate URL") from e
+        for item, url in zip(data, urls, strict=True):
+            item.url = url
+
     return ImagesPublic(
-        data=[ImagePublic.model_validate(img) for img in images],
+        data=data,
         count=count,
+        has_more=has_more,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/images/{image_id}", response_model=ImagePublic)
-async def read_image(session: SessionDep, _current_user: CurrentUser, image_id: uuid.UUID) -> Image:
+async def read_image(_current_user: CurrentUser, image: GetImage, request: Request, response: Response) -> Any:
     """Get image by ID.
 
+    Responds with 304 Not Modified when the client's If-None-Match still matches the image.
+
     Args:
-        session: Database session
         current_user: Authenticated user
-        image_id: Image UUID
+        image: Image resolved from the image_id path parameter
+        request: Incoming request, for If-None-Match
+        response: Outgoing response, for caching headers
 
     Returns:
-        Image record
+        Image record, or an empty 304 response
 
     Raises:
         HTTPException: If image not found
     """
-    image = await session.get(Image, image_id)
-    if not image:
-        raise HTTPException(status_code=404, detail="Image not found")
-    return image
+    # AIDEV-NOTE: The images table is also written by the picture display skill and the Immich
+    # sync, which need not bump updated_at, so the ETag hashes every public field instead.
+    data = construct_public(ImagePublic, [image])[0]
+    etag = f'"{hashlib.blake2b(orjson.dumps(data.model_dump()), digest_size=16).hexdigest()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": f"private, max-age={IMAGE_METADATA_MAX_AGE_SECONDS}"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=cache_headers)
+
+    response.headers.update(cache_headers)
+    return data
 
 
 @router.get("/images/{image_id}/url", response_model=PresignedUrlResponse)
 async def get_image_url(
-    session: SessionDep,
     _current_user: CurrentUser,
-    image_id: uuid.UUID,
+    image: GetImage,
+    response: Response,
     expires_hours: int = 1,
 ) -> PresignedUrlResponse:
     """Get presigned URL for image access.
 
     Args:
-        session: Database session
         current_user: Authenticated user
-        image_id: Image UUID
+        image: Image resolved from the image_id path parameter
+        response: Outgoing response, for caching headers
         expires_hours: URL expiration time in hours (default: 1)
 
     Returns:
@@ -169,17 +355,17 @@ async def get_image_url(
     Raises:
         HTTPException: If image not found or URL generation fails
     """
-    image = await session.get(Image, image_id)
-    if not image:
-        raise HTTPException(status_code=404, detail="Image not found")
-
     try:
-        url = MinIOClient.get_presigned_url(image.storage_path, expires_hours)
+        url, expires_in_seconds = await _get_presigned_url(image.storage_path, expires_hours)
     except Exception as e:
-        logger.error(f"Failed to generate presigned URL: {e}")
+        logger.error("Failed to generate presigned URL: %s", e)
         raise HTTPException(status_code=500, detail="Failed to generate URL") from e
 
-    return PresignedUrlResponse(url=url, expires_in_seconds=expires_hours * 3600)
+    # Let the browser reuse the URL for as long as the server-side cache would
+    reserve_seconds = expires_hours * 3600 * (1 - PRESIGNED_URL_REUSE_FRACTION)
+    response.headers["Cache-Control"] = f"private, max-age={max(0, int(expires_in_seconds - reserve_seconds))}"
+
+    return PresignedUrlResponse(url=url, expires_in_seconds=expires_in_seconds)
 
 
 @router.put("/images/{image_id}", response_model=ImagePublic)
@@ -204,31 +390,34 @@ async def update_image(
     Raises:
         HTTPException: If image not found
     """
-    image = await session.get(Image, image_id)
+    # Single UPDATE ... RETURNING; the database stamps updated_at and no row means not found
+    update_dict = image_in.model_dump(exclude_unset=True)
+    statement = (
+        update(Image).where(col(Image.id) == image_id).values(**update_dict, updated_at=func.now()).returning(Image)
+    )
+    result = await session.exec(statement)
+    image: Image | None = result.scalar_one_or_none()
     if not image:
         raise HTTPException(status_code=404, detail="Image not found")
 
-    update_dict = image_in.model_dump(exclude_unset=True)
-    image.sqlmodel_update(update_dict)
-
-    # Update timestamp
-    image.updated_at = datetime.now()
-
-    session.add(image)
     await session.commit()
-    await session.refresh(image)
-
     return image
 
 
 @router.delete("/images/{image_id}")
-async def delete_image(session: SessionDep, _current_user: CurrentUser, image_id: uuid.UUID) -> Message:
-    """Delete image from MinIO and database.
+async def delete_image(
+    session: SessionDep,
+    _current_user: CurrentUser,
+    image_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
+) -> Message:
+    """Delete image from database and MinIO.
 
     Args:
         session: Database session
         current_user: Authenticated user
         image_id: Image UUID
+        background_tasks: Runs the MinIO deletion after the response is sent
 
     Returns:
         Success message
@@ -236,18 +425,18 @@ async def delete_image(session: SessionDep, _current_user: CurrentUser, image_id
     Raises:
         HTTPException: If image not found
     """
-    image = await session.get(Image, image_id)
-    if not image:
+    # Single DELETE ... RETURNING: an empty result means the image did not exist
+    statement = delete(Image).where(col(Image.id) == image_id).returning(col(Image.storage_path))
+    result = await session.exec(statement)
+    storage_path = result.scalar_one_or_none()
+    if storage_path is None:
         raise HTTPException(status_code=404, detail="Image not found")
 
-    # Delete from MinIO first
-    try:
-        MinIOClient.delete_image(image.storage_path)
-    except Exception as e:
-        logger.warning(f"MinIO deletion failed (continuing): {e}")
-
-    # Delete from database
-    await session.delete(image)
     await session.commit()
 
+    # AIDEV-NOTE: The record goes first, so a failed MinIO delete leaves an orphaned object
+    # rather than a record pointing at a missing file.
+    _invalidate_presigned_urls(storage_path)
+    background_tasks.add_task(_delete_image_object, storage_path)
+
     return Message(message="Image deleted successfully")
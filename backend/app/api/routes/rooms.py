@@ -4,28 +4,30 @@ import uuid
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from private_assistant_commons.database.models import Room
-from sqlmodel import func, select
+from private_assistant_commons.database.models import GlobalDevice, Room
+from sqlalchemy import delete, update
+from sqlmodel import col, func, select
 
 from app.api.deps import CurrentUser, SessionDep
+from app.api.pagination import construct_public, fetch_list_page
 from app.models import Message
 from app.models_commons_api import RoomCreate, RoomPublic, RoomsPublic, RoomUpdate
 
 router = APIRouter(prefix="/rooms", tags=["rooms"])
 
+# Built once at import time; offset/limit are applied per request
+_ROOMS_LIST_STMT = select(Room)
 
-@router.get("/", response_model=RoomsPublic)
-async def read_rooms(session: SessionDep, _current_user: CurrentUser, skip: int = 0, limit: int = 100) -> Any:
-    """Retrieve rooms with pagination."""
-    count_statement = select(func.count()).select_from(Room)
-    result = await session.exec(count_statement)
-    count = result.one()
-
-    statement = select(Room).offset(skip).limit(limit)
-    result = await session.exec(statement)  # type: ignore[arg-type]
-    rooms = result.all()
 
-    return RoomsPublic(data=list(rooms), count=count)  # type: ignore[arg-type]
+@router.get("/", response_model=RoomsPublic)
+async def read_rooms(
+    session: SessionDep, _current_user: CurrentUser, skip: int = 0, limit: int = 100, with_count: bool = True
+) -> Any:
+    """Retrieve rooms with pagination; with_count=false skips the total count."""
+    rooms, count, has_more = await fetch_list_page(
+        session, _ROOMS_LIST_STMT, skip=skip, limit=limit, with_count=with_count
+    )
+    return RoomsPublic(data=construct_public(RoomPublic, rooms), count=count, has_more=has_more)
 
 
 @router.get("/{room_id}", response_model=RoomPublic)
@@ -43,7 +45,6 @@ async def create_room(*, session: SessionDep, _current_user: CurrentUser, room_i
     room = Room.model_validate(room_in)
     session.add(room)
     await session.commit()
-    await session.refresh(room)
     return room
 
 
@@ -56,25 +57,28 @@ async def update_room(
     room_in: RoomUpdate,
 ) -> Any:
     """Update a room."""
-    room = await session.get(Room, room_id)
+    # Single UPDATE ... RETURNING; the database stamps updated_at and no row means not found
+    update_dict = room_in.model_dump(exclude_unset=True)
+    statement = update(Room).where(col(Room.id) == room_id).values(**update_dict, updated_at=func.now()).returning(Room)
+    result = await session.exec(statement)
+    room = result.scalar_one_or_none()
     if not room:
         raise HTTPException(status_code=404, detail="Room not found")
 
-    update_dict = room_in.model_dump(exclude_unset=True)
-    room.sqlmodel_update(update_dict)
-    session.add(room)
     await session.commit()
-    await session.refresh(room)
     return room
 
 
 @router.delete("/{room_id}")
 async def delete_room(session: SessionDep, _current_user: CurrentUser, room_id: uuid.UUID) -> Message:
     """Delete a room."""
-    room = await session.get(Room, room_id)
-    if not room:
+    # AIDEV-NOTE: The ORM delete used to load the room and its devices just to null their room_id.
+    # Do the same with two statements in one transaction, without the preceding SELECTs.
+    await session.exec(update(GlobalDevice).where(col(GlobalDevice.room_id) == room_id).values(room_id=None))
+    statement = delete(Room).where(col(Room.id) == room_id).returning(col(Room.id))
+    result = await session.exec(statement)
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Room not found")
 
-    await session.delete(room)
     await session.commit()
     return Message(message="Room deleted successfully")
@@ -4,13 +4,15 @@ import uuid
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import func, select
+from sqlmodel import select
 
 from app.api.deps import (
     CurrentUser,
     SessionDep,
     get_current_active_superuser,
+    invalidate_oauth_user_cache,
 )
+from app.api.pagination import construct_public, fetch_list_page
 from app.models import (
     Message,
     User,
@@ -20,23 +22,21 @@ from app.models import (
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Built once at import time; offset/limit are applied per request
+_USERS_LIST_STMT = select(User)
+
 
 @router.get(
     "/",
     dependencies=[Depends(get_current_active_superuser)],
     response_model=UsersPublic,
 )
-async def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
-    """Retrieve users."""
-    count_statement = select(func.count()).select_from(User)
-    result = await session.exec(count_statement)
-    count = result.one()
-
-    statement = select(User).offset(skip).limit(limit)
-    result = await session.exec(statement)  # type: ignore[arg-type]
-    users = result.all()
-
-    return UsersPublic(data=list(users), count=count)  # type: ignore
+async def read_users(session: SessionDep, skip: int = 0, limit: int = 100, with_count: bool = True) -> Any:
+    """Retrieve users; with_count=false skips the total count."""
+    users, count, has_more = await fetch_list_page(
+        session, _USERS_LIST_STMT, skip=skip, limit=limit, with_count=with_count
+    )
+    return UsersPublic(data=construct_public(UserPublic, users), count=count, has_more=has_more)
 
 
 @router.get("/me", response_model=UserPublic)
@@ -67,6 +67,8 @@ async def delete_user(session: SessionDep, current_user: CurrentUser, user_id: u
         raise HTTPException(status_code=404, detail="User not found")
     if user == current_user:
         raise HTTPException(status_code=403, detail="Super users are not allowed to delete themselves")
+    oauth_subject = user.oauth_subject
     await session.delete(user)
     await session.commit()
+    invalidate_oauth_user_cache(oauth_subject)
     return Message(message="User deleted successfully")
@@ -5,9 +5,12 @@ They are separate from the database models to allow API-specific validation
 and response shaping.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
+from fastapi import Form
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -30,6 +33,7 @@ class ImagePublic(BaseModel):
     expires_at: datetime | None
     created_at: datetime
     updated_at: datetime
+    url: str | None = Field(default=None, description="Presigned URL, only set when requested")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -46,6 +50,21 @@ class ImageCreate(BaseModel):
     priority: int = Field(default=0, ge=0, le=100)
 
 
+@dataclass
+class ImageUploadForm:
+    """Form fields sent alongside an uploaded image file.
+
+    Used as Annotated[ImageUploadForm, Depends()], so FastAPI reads each field from the
+    multipart form while the route keeps a single parameter for all of them.
+    """
+
+    title: Annotated[str | None, Form()] = None
+    description: Annotated[str | None, Form()] = None
+    tags: Annotated[str | None, Form()] = None
+    display_duration_seconds: Annotated[int, Form()] = 3600
+    priority: Annotated[int, Form()] = 0
+
+
 class ImageUpdate(BaseModel):
     """API request model for updating images."""
 
@@ -60,4 +79,6 @@ class ImagesPublic(BaseModel):
     """Paginated response for images."""
 
     data: list[ImagePublic]
-    count: int
+    count: int | None
+    has_more: bool = False
+    next_cursor: str | None = None
@@ -1,8 +1,9 @@
 """Application configuration settings."""
 
+import re
 import secrets
 import warnings
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Annotated, Any, Literal, Self
 
 from pydantic import (
@@ -15,11 +16,14 @@ from pydantic import (
 )
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Splits a comma-separated origin list and strips the whitespace around each comma in one pass
+_CORS_SPLIT_RE = re.compile(r"\s*,\s*")
+
 
 def parse_cors(v: Any) -> list[str] | str:
     """Parse CORS origins from string or list."""
     if isinstance(v, str) and not v.startswith("["):
-        return [i.strip() for i in v.split(",") if i.strip()]
+        return [origin for origin in _CORS_SPLIT_RE.split(v.strip()) if origin]
     if isinstance(v, list | str):
         return v
     raise ValueError(v)
@@ -40,6 +44,12 @@ class PostgresSettings(BaseSettings):
     USER: str
     PASSWORD: str = ""
     DB: str = ""
+    POOL_SIZE: int = 10
+    MAX_OVERFLOW: int = 20
+    POOL_TIMEOUT_SECONDS: float = 10
+    POOL_RECYCLE_SECONDS: int = 1800
+    POOL_PRE_PING: bool = True
+    PREPARED_STATEMENT_CACHE_SIZE: int = 500
 
 
 class MQTTSettings(BaseSettings):
@@ -73,6 +83,8 @@ class MinIOSettings(BaseSettings):
     SECRET_KEY: str = "minioadmin"
     BUCKET_NAME: str = "assistant-images"
     SECURE: bool = False
+    # Sized for the default worker thread pool, which runs the blocking SDK calls
+    POOL_MAXSIZE: int = 32
 
 
 class OAuthSettings(BaseSettings):
@@ -123,10 +135,15 @@ class Settings(BaseSettings):
     oauth: OAuthSettings = Field(default_factory=OAuthSettings)
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
-    def all_cors_origins(self) -> list[str]:
-        """Get all CORS origins including frontend host."""
-        return [str(origin).rstrip("/") for origin in self.BACKEND_CORS_ORIGINS] + [self.FRONTEND_HOST]
+    @cached_property
+    def all_cors_origins(self) -> tuple[str, ...]:
+        """Get all CORS origins including frontend host (computed once per settings instance).
+
+        Returned as an immutable, de-duplicated tuple; CORSMiddleware checks request origins
+        against it on every cross-origin request.
+        """
+        origins = [str(origin).rstrip("/") for origin in self.BACKEND_CORS_ORIGINS] + [self.FRONTEND_HOST]
+        return tuple(dict.fromkeys(origins))
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -141,6 +158,18 @@ class Settings(BaseSettings):
             path=self.postgres.DB,
         )
 
+    @cached_property
+    def oauth_provider_name(self) -> str:
+        """Get the provider name derived from the OAuth issuer host.
+
+        Returns:
+            Issuer hostname without a leading "www.", or an empty string when no issuer is set.
+        """
+        if not self.oauth.ISSUER:
+            return ""
+        host = self.oauth.ISSUER.rstrip("/").split("//")[-1].split("/")[0]
+        return host.replace("www.", "")
+
     def _check_default_secret(self, var_name: str, value: str | None) -> None:
         """Check if a secret value is the default 'changethis' value."""
         if value == "changethis":
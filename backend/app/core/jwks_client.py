@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
 
 import httpx
+from joserfc.errors import JoseError
+from joserfc.jwk import KeySet
 
 from app.core.config import get_settings
 
@@ -19,8 +22,17 @@ class OAuthJWKSClient:
 
     def __init__(self) -> None:
         self._keys: dict | None = None
-        self._fetched_at: datetime | None = None
-        self._cache_duration = timedelta(hours=1)
+        # Deadlines are time.monotonic() values: cheap to read and immune to wall-clock jumps
+        self._expires_at = 0.0
+        self._cache_seconds = 3600.0
+        self._client: httpx.AsyncClient | None = None
+        # Last successfully fetched JWKS; survives clear_cache and fetch failures
+        self._last_good_keys: dict | None = None
+        # Parsed form of _last_good_keys, so key material is not re-imported per token
+        self._key_set: KeySet | None = None
+        self._retry_at = 0.0
+        self._retry_interval_seconds = 30.0
+        self._inflight = asyncio.Lock()
 
     @classmethod
     def get_instance(cls) -> OAuthJWKSClient:
@@ -37,29 +49,92 @@ class OAuthJWKSClient:
         # Zitadel uses /oauth/v2/keys instead of standard /.well-known/jwks.json
         return f"{settings.oauth.ISSUER}/oauth/v2/keys"
 
-    async def fetch_jwks(self) -> dict:
-        """Fetch JWKS from OAuth provider with caching."""
-        now = datetime.now()
-
-        # Return cached keys if still valid
-        if self._keys and self._fetched_at and now - self._fetched_at < self._cache_duration:
-            logger.debug("Using cached JWKS keys")
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client used for JWKS requests.
+
+        AIDEV-NOTE: Keys are refetched after every TTL expiry and key rotation; a shared client
+        keeps the connection to the IdP alive instead of paying a new TCP/TLS handshake each time.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if it was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _cached_keys(self, now: float) -> dict | None:
+        """Return the cached keys if they are still within the cache duration."""
+        if self._keys and now < self._expires_at:
             return self._keys
+        return None
 
-        # Fetch fresh keys
-        jwks_url = self._get_jwks_url()
-        logger.info(f"Fetching JWKS from {jwks_url}")
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(jwks_url, timeout=10.0)
-            response.raise_for_status()
-            self._keys = response.json()
-            self._fetched_at = now
-            logger.info(f"Fetched {len(self._keys.get('keys', []))} keys from JWKS")
-            return self._keys
+    async def fetch_jwks(self) -> dict:
+        """Fetch JWKS from OAuth provider with caching.
+
+        AIDEV-NOTE: Concurrent cache misses wait on one in-flight fetch instead of each calling
+        the IdP. When a fetch fails, the last good JWKS is served so token validation survives
+        short IdP outages, and no new fetch is attempted until the retry interval has passed.
+
+        Raises:
+            httpx.HTTPError: If the fetch fails and no keys were ever fetched successfully
+            RuntimeError: If no keys are available and the last failure is within the retry interval
+        """
+        cached = self._cached_keys(time.monotonic())
+        if cached is not None:
+            logger.debug("Using cached JWKS keys")
+            return cached
+
+        async with self._inflight:
+            now = time.monotonic()
+            # Another request may have refreshed the keys while this one waited
+            cached = self._cached_keys(now)
+            if cached is not None:
+                return cached
+
+            if now < self._retry_at:
+                if self._last_good_keys is not None:
+                    return self._last_good_keys
+                raise RuntimeError("JWKS unavailable, waiting before retrying the OAuth provider")
+
+            jwks_url = self._get_jwks_url()
+            logger.info("Fetching JWKS from %s", jwks_url)
+            try:
+                response = await self._get_client().get(jwks_url)
+                response.raise_for_status()
+                keys: dict = response.json()
+                key_set = KeySet.import_key_set(keys)  # type: ignore[arg-type]
+            except (httpx.HTTPError, JoseError, ValueError) as e:
+                self._retry_at = now + self._retry_interval_seconds
+                if self._last_good_keys is None:
+                    raise
+                logger.warning("Failed to fetch JWKS, serving last known keys: %s", e)
+                return self._last_good_keys
+
+            self._keys = self._last_good_keys = keys
+            self._key_set = key_set
+            self._expires_at = now + self._cache_seconds
+            self._retry_at = 0.0
+            logger.info("Fetched %s keys from JWKS", len(keys.get("keys", [])))
+            return keys
+
+    async def get_key_set(self) -> KeySet:
+        """Get the parsed key set for the current JWKS, fetching it if needed.
+
+        The key set is imported once per successful fetch rather than once per validated token.
+        """
+        await self.fetch_jwks()
+        if self._key_set is None:
+            raise RuntimeError("JWKS key set is not available")
+        return self._key_set
 
     def clear_cache(self) -> None:
         """Clear the cached JWKS keys."""
         self._keys = None
-        self._fetched_at = None
+        self._expires_at = 0.0
         logger.info("JWKS cache cleared")
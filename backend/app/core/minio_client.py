@@ -1,11 +1,15 @@
 """MinIO client for image storage."""
 
+import asyncio
 import logging
+import os
 import uuid
 from datetime import timedelta
-from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO
 
+import certifi
+import urllib3
 from minio import Minio
 from minio.error import S3Error
 
@@ -13,12 +17,20 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+_BUCKET_NAME = settings.minio.BUCKET_NAME
+
+# Multipart chunk size for streams of unknown length (S3 minimum part size); bounds upload memory
+UPLOAD_PART_SIZE = 5 * 1024 * 1024
+
 
 class MinIOClient:
     """Singleton MinIO client for image storage.
 
     AIDEV-NOTE: MinIO provides S3-compatible object storage for images.
     Presigned URLs are generated for frontend access with configurable expiration.
+    The minio SDK is blocking (HTTP and SigV4 signing), so the public methods are async and
+    run the SDK calls, including the lazy client and bucket setup, in a worker thread.
     """
 
     _instance: Minio | None = None
@@ -34,35 +46,59 @@ class MinIOClient:
             S3Error: If bucket creation or verification fails.
         """
         if cls._instance is None:
-            settings = get_settings()
             client = Minio(
                 settings.minio.ENDPOINT,
                 access_key=settings.minio.ACCESS_KEY,
                 secret_key=settings.minio.SECRET_KEY,
                 secure=settings.minio.SECURE,
+                http_client=cls._create_http_client(settings.minio.POOL_MAXSIZE),
             )
 
             # Ensure bucket exists
             try:
-                if not client.bucket_exists(settings.minio.BUCKET_NAME):
-                    client.make_bucket(settings.minio.BUCKET_NAME)
-                    logger.info(f"Created MinIO bucket: {settings.minio.BUCKET_NAME}")
+                if not client.bucket_exists(_BUCKET_NAME):
+                    client.make_bucket(_BUCKET_NAME)
+                    logger.info("Created MinIO bucket: %s", _BUCKET_NAME)
                 else:
-                    logger.info(f"MinIO bucket already exists: {settings.minio.BUCKET_NAME}")
+                    logger.info("MinIO bucket already exists: %s", _BUCKET_NAME)
             except S3Error as e:
-                logger.error(f"Failed to initialize MinIO bucket: {e}")
+                logger.error("Failed to initialize MinIO bucket: %s", e)
                 raise
 
             cls._instance = client
 
         return cls._instance
 
+    @staticmethod
+    def _create_http_client(maxsize: int) -> urllib3.PoolManager:
+        """Create the connection pool for MinIO requests.
+
+        AIDEV-NOTE: Mirrors the SDK's default PoolManager except for maxsize. The SDK keeps at
+        most 10 connections per host; with more concurrent worker threads, every extra request
+        opens a connection that is discarded afterwards instead of reused.
+        """
+        timeout = timedelta(minutes=5).total_seconds()
+        return urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            maxsize=maxsize,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+        )
+
     @classmethod
-    def upload_image(cls, file_data: bytes, file_name: str, content_type: str = "image/jpeg") -> str:
+    async def upload_image(
+        cls, data: BinaryIO, length: int | None, file_name: str, content_type: str = "image/jpeg"
+    ) -> str:
         """Upload image to MinIO.
 
+        The data is streamed from the file object, so the image is never held in memory as a whole.
+        When the length is unknown, the stream is sent as a multipart upload in UPLOAD_PART_SIZE
+        chunks.
+
         Args:
-            file_data: Binary image data.
+            data: Readable binary file object positioned at the start of the image.
+            length: Size of the image in bytes, or None if unknown.
             file_name: Original filename.
             content_type: MIME type of the image.
 
@@ -72,8 +108,12 @@ class MinIOClient:
         Raises:
             S3Error: If upload fails.
         """
+        return await asyncio.to_thread(cls._upload_image, data, length, file_name, content_type)
+
+    @classmethod
+    def _upload_image(cls, data: BinaryIO, length: int | None, file_name: str, content_type: str) -> str:
+        """Blocking implementation of upload_image."""
         client = cls.get_client()
-        settings = get_settings()
 
         # Generate unique storage path
         file_ext = Path(file_name).suffix or ".jpg"
@@ -81,22 +121,23 @@ class MinIOClient:
 
         try:
             client.put_object(
-                settings.minio.BUCKET_NAME,
+                _BUCKET_NAME,
                 storage_path,
-                BytesIO(file_data),
-                length=len(file_data),
+                data,
+                length=-1 if length is None else length,
+                part_size=UPLOAD_PART_SIZE if length is None else 0,
                 content_type=content_type,
             )
 
-            logger.info(f"Uploaded image to MinIO: {storage_path}")
+            logger.info("Uploaded image to MinIO: %s", storage_path)
             return storage_path
 
         except S3Error as e:
-            logger.error(f"Failed to upload image to MinIO: {e}")
+            logger.error("Failed to upload image to MinIO: %s", e)
             raise
 
     @classmethod
-    def delete_image(cls, storage_path: str) -> None:
+    async def delete_image(cls, storage_path: str) -> None:
         """Delete image from MinIO.
 
         Args:
@@ -105,18 +146,22 @@ class MinIOClient:
         Raises:
             S3Error: If deletion fails.
         """
+        await asyncio.to_thread(cls._delete_image, storage_path)
+
+    @classmethod
+    def _delete_image(cls, storage_path: str) -> None:
+        """Blocking implementation of delete_image."""
         client = cls.get_client()
-        settings = get_settings()
 
         try:
-            client.remove_object(settings.minio.BUCKET_NAME, storage_path)
-            logger.info(f"Deleted image from MinIO: {storage_path}")
+            client.remove_object(_BUCKET_NAME, storage_path)
+            logger.info("Deleted image from MinIO: %s", storage_path)
         except S3Error as e:
-            logger.error(f"Failed to delete image from MinIO: {e}")
+            logger.error("Failed to delete image from MinIO: %s", e)
             raise
 
     @classmethod
-    def get_presigned_url(cls, storage_path: str, expires_hours: int = 1) -> str:
+    async def get_presigned_url(cls, storage_path: str, expires_hours: int = 1) -> str:
         """Get presigned URL for image access.
 
         Args:
@@ -129,17 +174,39 @@ class MinIOClient:
         Raises:
             S3Error: If URL generation fails.
         """
+        return await asyncio.to_thread(cls._get_presigned_url, storage_path, expires_hours)
+
+    @classmethod
+    async def get_presigned_urls(cls, storage_paths: list[str], expires_hours: int = 1) -> list[str]:
+        """Get presigned URLs for several images in a single worker thread hop.
+
+        Args:
+            storage_paths: Object names in bucket.
+            expires_hours: URL expiration time in hours (default: 1).
+
+        Returns:
+            Presigned URLs in the order of storage_paths.
+
+        Raises:
+            S3Error: If URL generation fails.
+        """
+        return await asyncio.to_thread(
+            lambda: [cls._get_presigned_url(storage_path, expires_hours) for storage_path in storage_paths]
+        )
+
+    @classmethod
+    def _get_presigned_url(cls, storage_path: str, expires_hours: int) -> str:
+        """Blocking implementation of get_presigned_url."""
         client = cls.get_client()
-        settings = get_settings()
 
         try:
             url = client.presigned_get_object(
-                settings.minio.BUCKET_NAME,
+                _BUCKET_NAME,
                 storage_path,
                 expires=timedelta(hours=expires_hours),
             )
-            logger.debug(f"Generated presigned URL for: {storage_path}")
+            logger.debug("Generated presigned URL for: %s", storage_path)
             return url
         except S3Error as e:
-            logger.error(f"Failed to generate presigned URL: {e}")
+            logger.error("Failed to generate presigned URL: %s", e)
             raise
@@ -1,55 +1,128 @@
 """MQTT client for publishing device updates."""
 
-import json
+from __future__ import annotations
+
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack
+from functools import lru_cache
 from typing import Any
 
 import aiomqtt
+import orjson
 from private_assistant_commons import skill_config
 
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+
+@lru_cache(maxsize=1)
+def _get_device_update_topic() -> str:
+    """Resolve the device update topic once, on first publish.
+
+    SkillConfig is a BaseSettings model that reads the environment on construction, so it is
+    built lazily: a configuration error then fails the publish instead of the app import.
+    """
+    return skill_config.SkillConfig().device_update_topic
+
 
 # AIDEV-NOTE: This client is publish-only. The web-ui does not subscribe
 # to MQTT topics; it only publishes device registry updates.
-# aiomqtt uses async context managers instead of singleton pattern.
-
 
-@asynccontextmanager
-async def get_mqtt_client():
-    """Get MQTT client context manager.
 
-    Yields:
-        Connected aiomqtt client instance.
+class MQTTPublisher:
+    """Long-lived MQTT connection shared by all publishes (singleton).
 
-    Raises:
-        Exception: If connection to MQTT broker fails.
+    AIDEV-NOTE: Connecting per message cost a TCP and MQTT CONNECT handshake on every device
+    write. The connection is opened lazily on the first publish, so the API still starts while
+    the broker is down, re-established once if a publish fails, and closed in the app lifespan.
     """
-    settings = get_settings()
-    async with aiomqtt.Client(
-        hostname=settings.mqtt.HOST,
-        port=settings.mqtt.PORT,
-        username=settings.mqtt.USERNAME if settings.mqtt.USERNAME else None,
-        password=settings.mqtt.PASSWORD if settings.mqtt.PASSWORD else None,
-    ) as client:
-        logger.info(f"MQTT client connected to {settings.mqtt.HOST}:{settings.mqtt.PORT}")
-        yield client
+
+    _instance: MQTTPublisher | None = None
+
+    def __init__(self) -> None:
+        self._client: aiomqtt.Client | None = None
+        # Owns the connected client's context; closing it disconnects that client
+        self._stack: AsyncExitStack | None = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def get_instance(cls) -> MQTTPublisher:
+        """Get or create the singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    async def _get_client(self) -> aiomqtt.Client:
+        """Return the connected client, connecting first if needed.
+
+        Raises:
+            aiomqtt.MqttError: If connection to MQTT broker fails.
+        """
+        async with self._lock:
+            if self._client is None:
+                client = aiomqtt.Client(
+                    hostname=settings.mqtt.HOST,
+                    port=settings.mqtt.PORT,
+                    username=settings.mqtt.USERNAME if settings.mqtt.USERNAME else None,
+                    password=settings.mqtt.PASSWORD if settings.mqtt.PASSWORD else None,
+                )
+                stack = AsyncExitStack()
+                await stack.enter_async_context(client)
+                self._client = client
+                self._stack = stack
+                logger.info("MQTT client connected to %s:%s", settings.mqtt.HOST, settings.mqtt.PORT)
+            return self._client
+
+    async def _disconnect(self, client: aiomqtt.Client) -> None:
+        """Drop a client, unless a concurrent publish already replaced it."""
+        async with self._lock:
+            if self._client is not client or self._stack is None:
+                return
+            stack = self._stack
+            self._client = None
+            self._stack = None
+        try:
+            await stack.aclose()
+        except aiomqtt.MqttError as e:
+            logger.debug("Error while disconnecting MQTT client: %s", e)
+
+    async def publish(self, topic: str, payload: str | bytes, qos: int = 1) -> None:
+        """Publish a message, reconnecting once if the connection was lost.
+
+        Raises:
+            aiomqtt.MqttError: If the message could not be published after reconnecting.
+        """
+        for attempt in range(2):
+            client = await self._get_client()
+            try:
+                await client.publish(topic, payload, qos=qos)
+                return
+            except aiomqtt.MqttError:
+                await self._disconnect(client)
+                if attempt:
+                    raise
+                logger.warning("MQTT publish failed, reconnecting")
+
+    async def aclose(self) -> None:
+        """Close the connection if it was opened."""
+        if self._client is not None:
+            await self._disconnect(self._client)
 
 
 async def publish_device_update(device_id: str, action: str) -> None:
     """Publish device update to MQTT.
 
+    Runs as a background task after the response is sent, so failures are
+    logged instead of raised; MQTT errors never fail the originating request.
+
     Args:
         device_id: UUID of the device.
         action: Action type: 'created', 'updated', or 'deleted'.
-
-    Raises:
-        Exception: If MQTT publish fails.
     """
-    topic = skill_config.SkillConfig().device_update_topic
     payload: dict[str, Any] = {
         "device_id": device_id,
         "action": action,
@@ -57,9 +130,7 @@ async def publish_device_update(device_id: str, action: str) -> None:
     }
 
     try:
-        async with get_mqtt_client() as client:
-            await client.publish(topic, json.dumps(payload), qos=1)
-            logger.info(f"Published device {action}: {device_id}")
+        await MQTTPublisher.get_instance().publish(_get_device_update_topic(), orjson.dumps(payload), qos=1)
+        logger.info("Published device %s: %s", action, device_id)
     except Exception as e:
-        logger.error(f"Error publishing to MQTT: {e}")
-        raise
+        logger.error("Failed to publish MQTT event for device %s: %s", action, e)
@@ -1,15 +1,18 @@
 """Security utilities for JWT token validation and password hashing."""
 
+import asyncio
 import base64
+import hashlib
 import json
 import logging
+import time
 from datetime import UTC, datetime, timedelta
-from functools import lru_cache
 from typing import Any, Literal
 
+from cachetools import TLRUCache
 from joserfc import jwt as joserfc_jwt
 from joserfc.errors import JoseError
-from joserfc.jwk import KeySet, OctKey
+from joserfc.jwk import OctKey
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
@@ -17,11 +20,21 @@ from app.core.jwks_client import OAuthJWKSClient
 
 logger = logging.getLogger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+settings = get_settings()
+
+# AIDEV-NOTE: New hashes use argon2; bcrypt stays listed so existing hashes still verify and
+# are upgraded to argon2 on the next successful login (see verify_and_update_password).
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__rounds=3,
+    argon2__memory_cost=65536,
+    argon2__parallelism=2,
+)
 
 ALGORITHM = "HS256"
-JWT_PARTS_COUNT = 3
 BASE64_PADDING_MODULUS = 4
+TOKEN_CACHE_MAX_TTL_SECONDS = 60
 
 # Token type literals
 TokenTypeValue = Literal["local", "oauth"]
@@ -34,47 +47,56 @@ class TokenType:
     OAUTH: TokenTypeValue = "oauth"
 
 
-@lru_cache(maxsize=1)
-def _get_local_key() -> OctKey:
-    """Get or create the symmetric key for local JWT operations."""
-    return OctKey.import_key(get_settings().SECRET_KEY)
+# Symmetric key and header for local JWTs; SECRET_KEY is fixed for the process lifetime
+_LOCAL_KEY = OctKey.import_key(settings.SECRET_KEY)
+_LOCAL_HEADER = {"alg": ALGORITHM}
+
+ValidatedToken = tuple[dict[str, Any], TokenTypeValue]
+
+
+def _token_cache_expiry(_key: bytes, value: ValidatedToken, now: float) -> float:
+    """Expire a cached validation result at the token's own exp, but never later than the max TTL."""
+    payload, _ = value
+    return min(float(payload["exp"]), now + TOKEN_CACHE_MAX_TTL_SECONDS)
+
+
+# AIDEV-NOTE: Keyed by a truncated SHA-256 of the raw token so bearer tokens are not retained in memory.
+# Only successful validations are inserted; failures always go through full validation again.
+_token_cache: TLRUCache[bytes, ValidatedToken] = TLRUCache(maxsize=10_000, ttu=_token_cache_expiry, timer=time.time)
 
 
 def detect_token_type(token: str) -> TokenTypeValue:
-    """Detect token type by inspecting issuer claim (no validation)."""
+    """Detect token type from the JOSE header (no validation).
+
+    AIDEV-NOTE: Local tokens are always HS256 without a kid, while OAuth providers sign with
+    asymmetric keys identified by kid. Only the small header segment is decoded; the payload
+    is left to the validator that owns the token type.
+    """
     try:
         # JWT format is: header.payload.signature
-        parts = token.split(".")
-        if len(parts) != JWT_PARTS_COUNT:
-            logger.debug("Token does not have 3 parts, treating as local")
+        header_b64, separator, _ = token.partition(".")
+        if not separator:
+            logger.debug("Token is not a JWT, treating as local")
             return TokenType.LOCAL
 
-        # Decode the payload (second part) - add padding if needed
-        payload_b64 = parts[1]
-        padding = BASE64_PADDING_MODULUS - (len(payload_b64) % BASE64_PADDING_MODULUS)
-        if padding != BASE64_PADDING_MODULUS:
-            payload_b64 += "=" * padding
-
-        payload_bytes = base64.urlsafe_b64decode(payload_b64)
-        payload = json.loads(payload_bytes)
+        padding = -len(header_b64) % BASE64_PADDING_MODULUS
+        header = json.loads(base64.urlsafe_b64decode(header_b64 + "=" * padding))
 
-        issuer = payload.get("iss")
-        settings = get_settings()
-        if issuer and settings.oauth.ISSUER and issuer.rstrip("/") == settings.oauth.ISSUER.rstrip("/"):
-            logger.debug(f"Detected OAuth token from issuer: {issuer}")
-            return TokenType.OAUTH
+        if header.get("alg") == ALGORITHM and "kid" not in header:
+            logger.debug("Detected local token")
+            return TokenType.LOCAL
 
-        logger.debug("Detected local token")
-        return TokenType.LOCAL
+        logger.debug("Detected OAuth token with kid: %s", header.get("kid"))
+        return TokenType.OAUTH
     except Exception as e:
-        logger.warning(f"Error detecting token type: {e}, defaulting to local")
+        logger.warning("Error detecting token type: %s, defaulting to local", e)
         return TokenType.LOCAL
 
 
 def validate_local_token(token: str) -> dict[str, Any]:
     """Validate local HS256 JWT token using joserfc."""
     try:
-        token_obj = joserfc_jwt.decode(token, _get_local_key())
+        token_obj = joserfc_jwt.decode(token, _LOCAL_KEY)
         return dict(token_obj.claims)
     except JoseError as e:
         raise ValueError(f"Local token validation failed: {e}") from e
@@ -88,28 +110,22 @@ async def validate_oauth_token(token: str) -> dict[str, Any]:
     2. Uses joserfc to decode and validate the JWT
     3. Verifies issuer, expiration, subject, and optionally audience
     """
-    settings = get_settings()
     if settings.DISABLE_OAUTH or not settings.oauth.ISSUER:
         raise ValueError("OAuth is disabled or not configured")
 
-    # Fetch JWKS from provider
+    # Fetch the parsed JWKS key set (cached by the client)
     try:
-        jwks_data = await OAuthJWKSClient.get_instance().fetch_jwks()
-        logger.debug(f"JWKS fetched with {len(jwks_data.get('keys', []))} keys")
+        key_set = await OAuthJWKSClient.get_instance().get_key_set()
     except Exception as e:
-        logger.error(f"Failed to fetch JWKS: {e}")
+        logger.error("Failed to fetch JWKS: %s", e)
         raise ValueError(f"Failed to fetch JWKS: {e}") from e
 
-    # Import the key set
-    try:
-        key_set = KeySet.import_key_set(jwks_data)  # type: ignore[arg-type]
-    except Exception as e:
-        logger.error(f"Failed to import JWKS key set: {e}")
-        raise ValueError(f"Invalid JWKS format: {e}") from e
-
     try:
         # Decode token (signature verification)
-        token_obj = joserfc_jwt.decode(token, key_set)
+        # AIDEV-NOTE: RSA/EC verification is pure CPU work, so it runs in the default thread
+        # pool instead of stalling every in-flight request. Local HS256 tokens stay inline,
+        # an HMAC check is cheaper than the thread hop.
+        token_obj = await asyncio.to_thread(joserfc_jwt.decode, token, key_set)
 
         # Build claims registry for validation
         claims_registry = joserfc_jwt.JWTClaimsRegistry(
@@ -129,22 +145,33 @@ async def validate_oauth_token(token: str) -> dict[str, Any]:
                 if settings.oauth.CLIENT_ID not in aud_list:
                     raise JoseError("Invalid audience")
 
-        logger.info(f"OAuth token validated successfully for sub={token_obj.claims.get('sub')}")
+        logger.info("OAuth token validated successfully for sub=%s", token_obj.claims.get("sub"))
         return dict(token_obj.claims)
     except JoseError as e:
-        logger.error(f"OAuth token validation failed: {e}")
+        logger.error("OAuth token validation failed: %s", e)
         raise ValueError(f"OAuth token validation failed: {e}") from e
 
 
-async def validate_token(token: str) -> tuple[dict[str, Any], TokenTypeValue]:
-    """Validate JWT token (auto-detect local vs OAuth)."""
-    token_type = detect_token_type(token)
+async def validate_token(token: str) -> ValidatedToken:
+    """Validate JWT token (auto-detect local vs OAuth).
+
+    Tokens are immutable until they expire, so a successful result is reused for repeat
+    requests with the same token, for at most TOKEN_CACHE_MAX_TTL_SECONDS.
+    """
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    cached = _token_cache.get(key)
+    if cached is not None:
+        return cached
 
+    token_type = detect_token_type(token)
     if token_type == TokenType.OAUTH:
         payload = await validate_oauth_token(token)
-        return payload, TokenType.OAUTH
-    payload = validate_local_token(token)
-    return payload, TokenType.LOCAL
+    else:
+        payload = validate_local_token(token)
+
+    if isinstance(payload.get("exp"), int | float):
+        _token_cache[key] = (payload, token_type)
+    return payload, token_type
 
 
 def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
@@ -152,14 +179,21 @@ def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     expire = datetime.now(UTC) + expires_delta
     # joserfc expects exp as Unix timestamp
     claims = {"exp": int(expire.timestamp()), "sub": str(subject)}
-    return joserfc_jwt.encode({"alg": ALGORITHM}, claims, _get_local_key())
+    return joserfc_jwt.encode(_LOCAL_HEADER, claims, _LOCAL_KEY)
+
 
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify a password and return a replacement hash if the stored one uses a deprecated scheme.
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    Hashing is deliberately slow CPU work, so it runs in the default thread pool instead of
+    blocking the event loop.
+
+    Returns:
+        Whether the password matches, and the new hash to store (None if no upgrade is needed)
+    """
+    return await asyncio.to_thread(pwd_context.verify_and_update, plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """Hash a password for storage."""
-    return pwd_context.hash(password)
+    return await asyncio.to_thread(pwd_context.hash, password)
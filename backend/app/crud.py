@@ -1,28 +1,31 @@
-from sqlmodel import select
+from sqlalchemy import bindparam
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, verify_and_update_password
 from app.models import User, UserCreate
 
+# Built once at import; callers only bind parameter values
+_USER_BY_EMAIL_STMT = select(User).where(col(User.email) == bindparam("email"))
+_USER_BY_OAUTH_SUBJECT_STMT = select(User).where(col(User.oauth_subject) == bindparam("oauth_subject"))
+
 
 async def create_user(*, session: AsyncSession, user_create: UserCreate) -> User:
-    db_obj = User.model_validate(user_create, update={"hashed_password": get_password_hash(user_create.password)})
+    hashed_password = await get_password_hash(user_create.password)
+    db_obj = User.model_validate(user_create, update={"hashed_password": hashed_password})
     session.add(db_obj)
     await session.commit()
-    await session.refresh(db_obj)
     return db_obj
 
 
 async def get_user_by_email(*, session: AsyncSession, email: str) -> User | None:
-    statement = select(User).where(User.email == email)
-    result = await session.exec(statement)
+    result = await session.exec(_USER_BY_EMAIL_STMT, params={"email": email})
     return result.first()
 
 
 async def get_user_by_oauth_subject(*, session: AsyncSession, oauth_subject: str) -> User | None:
     """Get user by OAuth subject (OAuth provider sub claim)."""
-    statement = select(User).where(User.oauth_subject == oauth_subject)
-    result = await session.exec(statement)
+    result = await session.exec(_USER_BY_OAUTH_SUBJECT_STMT, params={"oauth_subject": oauth_subject})
     return result.first()
 
 
@@ -33,6 +36,11 @@ async def authenticate(*, session: AsyncSession, email: str, password: str) -> U
     # OAuth users don't have passwords
     if not db_user.hashed_password:
         return None
-    if not verify_password(password, db_user.hashed_password):
+    verified, new_hash = await verify_and_update_password(password, db_user.hashed_password)
+    if not verified:
         return None
+    if new_hash:
+        # Stored hash uses a deprecated scheme (e.g. bcrypt); replace it while the password is known
+        db_user.hashed_password = new_hash
+        await session.commit()
     return db_user
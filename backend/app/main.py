@@ -6,12 +6,18 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
+from sqlalchemy.orm import configure_mappers
 from starlette.middleware.cors import CORSMiddleware
 
+from app.api.deps import close_userinfo_client
 from app.api.main import api_router
 from app.api.schemas.health import HealthResponse
 from app.core.config import get_settings
+from app.core.db import get_engine
+from app.core.jwks_client import OAuthJWKSClient
+from app.core.mqtt import MQTTPublisher
 
 # Configure logging
 logging.basicConfig(
@@ -28,11 +34,25 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan context manager."""
     logger.info("Starting application...")
+    # AIDEV-NOTE: Move first-request costs into startup. Mappers are otherwise configured on the
+    # first query, and the first pooled connection pays TCP, auth and asyncpg type setup.
+    configure_mappers()
+    try:
+        async with get_engine().connect():
+            pass
+    except Exception as e:
+        # The database may come up after the API; requests will connect on demand
+        logger.warning("Database warm-up failed: %s", e)
+    app.state.jwks_client = OAuthJWKSClient.get_instance()
+    app.state.mqtt = MQTTPublisher.get_instance()
     yield
     logger.info("Shutting down application...")
+    await close_userinfo_client()
+    await app.state.jwks_client.aclose()
+    await app.state.mqtt.aclose()
 
 
 settings = get_settings()
@@ -40,6 +60,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
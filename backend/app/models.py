@@ -2,9 +2,14 @@ import uuid
 
 # Import picture display models from skill package to register with SQLModel
 from private_assistant_picture_display_skill.models.device import DeviceDisplayState  # noqa: F401
-from private_assistant_picture_display_skill.models.image import Image  # noqa: F401
+from private_assistant_picture_display_skill.models.image import Image
 from private_assistant_picture_display_skill.models.immich_sync_job import ImmichSyncJob  # noqa: F401
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel, col
+
+# AIDEV-NOTE: Keyset pagination index for /picture-display/images/, created by migration
+# b3c5e1f7a2d4. Registered on the skill's images table so autogenerate does not drop it.
+Index("ix_images_created_at_id", col(Image.created_at).desc(), col(Image.id).desc())
 
 
 # Shared properties
@@ -35,7 +40,8 @@ class UserPublic(UserBase):
 
 class UsersPublic(SQLModel):
     data: list[UserPublic]
-    count: int
+    count: int | None
+    has_more: bool = False
 
 
 # Generic message
@@ -42,7 +42,8 @@ class RoomsPublic(SQLModel):
     """Paginated response for rooms."""
 
     data: list[RoomPublic]
-    count: int
+    count: int | None
+    has_more: bool = False
 
 
 # DeviceType Models
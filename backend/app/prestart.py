@@ -9,7 +9,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from tenacity import after_log, before_log, retry, stop_after_attempt, wait_fixed
 
-from app.core.db import get_engine, init_db
+from app.core.db import get_engine, get_session_factory, init_db
 
 logger = logging.getLogger(__name__)
 
@@ -51,18 +51,20 @@ def main() -> None:
     Runs DB wait and init data as async, but migrations synchronously
     because alembic's env.py already handles its own async loop.
 
-    Note: We clear the engine cache between asyncio.run() calls because
-    each creates a new event loop, and the cached engine's connection pool
-    is tied to a specific event loop.
+    Note: We clear the engine and session factory caches between asyncio.run()
+    calls because each creates a new event loop, and the cached engine's
+    connection pool is tied to a specific event loop.
     """
     logger.info("Waiting for database...")
     asyncio.run(wait_for_db())
     get_engine.cache_clear()  # Clear engine cache before alembic creates its own loop
+    get_session_factory.cache_clear()
     logger.info("Database is ready")
 
     logger.info("Running database migrations...")
     run_migrations()
     get_engine.cache_clear()  # Clear again after alembic's loop
+    get_session_factory.cache_clear()
     logger.info("Migrations complete")
 
     logger.info("Creating initial data...")
@@ -23,18 +23,21 @@ from private_assistant_picture_display_skill.models.device import (  # noqa: F40
     DeviceDisplayState,
 )
 from private_assistant_picture_display_skill.models.image import Image  # noqa: F401
-from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel
 
-from app.core.config import get_settings
+from app.core.db import get_engine
 
 # Import all models to register them with SQLModel metadata
 from app.models import User  # noqa: F401
 
 
 async def create_tables():
-    """Create all database tables."""
-    engine = create_async_engine(str(get_settings().SQLALCHEMY_DATABASE_URI), echo=True)
+    """Create all database tables.
+
+    Uses the application's engine, so the script gets the same pool and connection settings
+    (and no per-statement echo logging).
+    """
+    engine = get_engine()
 
     async with engine.begin() as conn:
         # Create all tables defined in SQLModel metadata
@@ -5,9 +5,11 @@ device IDs, or personally identifiable information.
 """
 
 import random
-import uuid
 from typing import Any
 
+# Shared generator for all random fields; seeded data is fictional, so no cryptographic source is needed
+_rng = random.Random()
+
 # Fictional room names
 ROOMS = ["bedroom", "living room", "kitchen", "bathroom", "hall", "office", "garage", "basement"]
 
@@ -78,7 +80,7 @@ def generate_scene_attributes(scene_name: str, actions_count: int = 3) -> dict[s
         actions.append(
             {
                 "topic": f"fictional2mqtt/scene/{scene_name}/action_{i}/set",
-                "payload": f'{{"state": "ON", "brightness": {random.randint(50, 254)}}}',
+                "payload": f'{{"state": "ON", "brightness": {_rng.randint(50, 254)}}}',
             }
         )
     return {"device_actions": actions}
@@ -87,21 +89,21 @@ def generate_scene_attributes(scene_name: str, actions_count: int = 3) -> dict[s
 def generate_picture_display_attributes() -> dict[str, Any]:
     """Generate attributes for picture display devices."""
     return {
-        "display_width": random.choice([1600, 1920, 800]),
-        "display_height": random.choice([1200, 1080, 600]),
-        "orientation": random.choice(["landscape", "portrait"]),
-        "model": f"fictional_display_{random.randint(1, 10)}",
+        "display_width": _rng.choice([1600, 1920, 800]),
+        "display_height": _rng.choice([1200, 1080, 600]),
+        "orientation": _rng.choice(["landscape", "portrait"]),
+        "model": f"fictional_display_{_rng.randint(1, 10)}",
     }
 
 
 def generate_spotify_attributes() -> dict[str, Any]:
     """Generate attributes for Spotify devices."""
     # Generate a fictional Spotify device ID (40-char hex)
-    spotify_id = uuid.uuid4().hex + uuid.uuid4().hex[:8]
+    spotify_id = _rng.randbytes(20).hex()
     return {
         "spotify_id": spotify_id,
-        "is_main": random.choice([True, False]),
-        "default_volume": random.randint(30, 70),
+        "is_main": _rng.choice([True, False]),
+        "default_volume": _rng.randint(30, 70),
     }
 
 
@@ -109,19 +111,20 @@ def generate_device_attributes(device_type: str, room: str | None, device_name:
     """Generate appropriate attributes based on device type."""
     room_name = room or "common"
 
-    # Map device types to their attribute generators
-    generators: dict[str, dict[str, Any] | None] = {
-        "light": generate_switch_attributes(room_name, device_name),
-        "switch": generate_switch_attributes(room_name, device_name),
-        "plug": generate_switch_attributes(room_name, device_name),
-        "bulb": generate_switch_attributes(room_name, device_name),
-        "thermostat": generate_thermostat_attributes(room_name),
-        "curtain": generate_curtain_attributes(room_name, device_name),
-        "scene": generate_scene_attributes(device_name),
-        "picture_display": generate_picture_display_attributes(),
-        "spotify_device": generate_spotify_attributes(),
+    # Map device types to their attribute generators; only the matching one is called
+    generators = {
+        "light": lambda: generate_switch_attributes(room_name, device_name),
+        "switch": lambda: generate_switch_attributes(room_name, device_name),
+        "plug": lambda: generate_switch_attributes(room_name, device_name),
+        "bulb": lambda: generate_switch_attributes(room_name, device_name),
+        "thermostat": lambda: generate_thermostat_attributes(room_name),
+        "curtain": lambda: generate_curtain_attributes(room_name, device_name),
+        "scene": lambda: generate_scene_attributes(device_name),
+        "picture_display": generate_picture_display_attributes,
+        "spotify_device": generate_spotify_attributes,
     }
-    return generators.get(device_type)  # Returns None for unknown types
+    generator = generators.get(device_type)
+    return generator() if generator else None  # Returns None for unknown types
 
 
 # Fictional device names by type
@@ -1,7 +1,9 @@
-"""Factory Boy factories for database seeding.
+"""Factory Boy factories and builders for database seeding.
 
-AIDEV-NOTE: These factories use Factory.build() to create model instances
-without database persistence. The seed script handles async insertion.
+AIDEV-NOTE: The factories create model instances without database persistence and are
+kept for ad-hoc fixtures. The build_* helpers and make_device construct models directly:
+they run for every seeded row, and Factory Boy's declaration resolution costs far more than
+a constructor call while every field is supplied explicitly anyway.
 """
 
 import uuid
@@ -23,48 +25,73 @@ from .data_generators import (
     generate_device_attributes,
 )
 
+# Timestamp shared by every row of a seed run; set by freeze_now
+_seed_now: datetime | None = None
+
+
+def freeze_now() -> datetime:
+    """Fix the timestamp returned by utcnow for the rest of the seed run.
+
+    AIDEV-NOTE: All rows of one run share a created_at/updated_at value, so the clock is read
+    once here instead of twice per built row.
+    """
+    global _seed_now  # noqa: PLW0603
+    _seed_now = datetime.utcnow()
+    return _seed_now
+
 
 def utcnow() -> datetime:
     """Return current UTC time as naive datetime (no timezone info).
 
+    Returns the timestamp fixed by freeze_now when one is set.
+
     AIDEV-NOTE: Database uses TIMESTAMP WITHOUT TIME ZONE, so we must
     provide naive datetimes. Using datetime.utcnow() pattern.
     """
-    return datetime.utcnow()
+    return _seed_now or datetime.utcnow()
 
 
 class RoomFactory(factory.Factory):
-    """Factory for Room model."""
+    """Factory for Room model.
+
+    AIDEV-NOTE: name is unique in the database; pass it explicitly when building more than one.
+    """
 
     class Meta:
         model = Room
 
     id = factory.LazyFunction(uuid.uuid4)
-    name = factory.Iterator(ROOMS)
+    name = "room"
     created_at = factory.LazyFunction(utcnow)
     updated_at = factory.LazyFunction(utcnow)
 
 
 class DeviceTypeFactory(factory.Factory):
-    """Factory for DeviceType model."""
+    """Factory for DeviceType model.
+
+    AIDEV-NOTE: name is unique in the database; pass it explicitly when building more than one.
+    """
 
     class Meta:
         model = DeviceType
 
     id = factory.LazyFunction(uuid.uuid4)
-    name = factory.Iterator(DEVICE_TYPES)
+    name = "device_type"
     created_at = factory.LazyFunction(utcnow)
     updated_at = factory.LazyFunction(utcnow)
 
 
 class SkillFactory(factory.Factory):
-    """Factory for Skill model."""
+    """Factory for Skill model.
+
+    AIDEV-NOTE: name is unique in the database; pass it explicitly when building more than one.
+    """
 
     class Meta:
         model = Skill
 
     id = factory.LazyFunction(uuid.uuid4)
-    name = factory.Iterator(SKILLS)
+    name = "skill"
     created_at = factory.LazyFunction(utcnow)
     updated_at = factory.LazyFunction(utcnow)
 
@@ -80,7 +107,7 @@ class GlobalDeviceFactory(factory.Factory):
         model = GlobalDevice
 
     id = factory.LazyFunction(uuid.uuid4)
-    name = factory.Faker("word")
+    name = "device"
     pattern = factory.LazyAttribute(lambda obj: [obj.name.lower()])
     device_type_id = factory.LazyFunction(uuid.uuid4)
     room_id = None
@@ -89,19 +116,6 @@ class GlobalDeviceFactory(factory.Factory):
     created_at = factory.LazyFunction(utcnow)
     updated_at = factory.LazyFunction(utcnow)
 
-    @classmethod
-    def build_with_attributes(
-        cls,
-        device_type_name: str,
-        room_name: str | None,
-        **kwargs: Any,
-    ) -> GlobalDevice:
-        """Build a device with appropriate attributes based on device type."""
-        name = kwargs.get("name", "device")
-        attributes = generate_device_attributes(device_type_name, room_name, name)
-        result: GlobalDevice = cls.build(device_attributes=attributes, **kwargs)
-        return result
-
 
 class ImageFactory(factory.Factory):
     """Factory for Image model from skill package."""
@@ -138,61 +152,98 @@ class DeviceDisplayStateFactory(factory.Factory):
     scheduled_next_at = factory.LazyFunction(utcnow)
 
 
+def make_device(  # noqa: PLR0913
+    device_type_name: str,
+    room_name: str | None,
+    name: str,
+    device_type_id: uuid.UUID,
+    room_id: uuid.UUID | None,
+    skill_id: uuid.UUID,
+    now: datetime | None = None,
+) -> GlobalDevice:
+    """Build a device with attributes generated for its device type."""
+    now = now or utcnow()
+    return GlobalDevice(
+        id=uuid.uuid4(),
+        name=name,
+        pattern=[name.lower()],
+        device_type_id=device_type_id,
+        room_id=room_id,
+        skill_id=skill_id,
+        device_attributes=generate_device_attributes(device_type_name, room_name, name),
+        created_at=now,
+        updated_at=now,
+    )
+
+
 # Pre-built data collections for convenience
 def build_all_rooms() -> list[Room]:
     """Build all predefined rooms."""
-    return [RoomFactory.build(name=name) for name in ROOMS]
+    now = utcnow()
+    return [Room(id=uuid.uuid4(), name=name, created_at=now, updated_at=now) for name in ROOMS]
 
 
 def build_all_device_types() -> list[DeviceType]:
     """Build all predefined device types."""
-    return [DeviceTypeFactory.build(name=name) for name in DEVICE_TYPES]
+    now = utcnow()
+    return [DeviceType(id=uuid.uuid4(), name=name, created_at=now, updated_at=now) for name in DEVICE_TYPES]
 
 
 def build_all_skills() -> list[Skill]:
     """Build all predefined skills."""
-    return [SkillFactory.build(name=name) for name in SKILLS]
+    now = utcnow()
+    return [Skill(id=uuid.uuid4(), name=name, created_at=now, updated_at=now) for name in SKILLS]
 
 
 def build_all_images() -> list[Image]:
     """Build all predefined images."""
-    return [ImageFactory.build(**img_data) for img_data in IMAGE_DATA]
+    now = utcnow()
+    return [Image(id=uuid.uuid4(), created_at=now, updated_at=now, **img_data) for img_data in IMAGE_DATA]
+
+
+# Device type name, its type and skill rows, and the device names to build in each room
+type DeviceSpec = tuple[str, DeviceType, Skill, list[str]]
+
+# Device types that are not placed in rooms; built by build_roomless_devices
+ROOMLESS_DEVICE_TYPES = ("scene", "spotify_device")
 
 
-def build_devices_for_room(
-    room: Room,
+def resolve_room_device_specs(
     device_types: dict[str, DeviceType],
     skills: dict[str, Skill],
-) -> list[GlobalDevice]:
-    """Build devices for a specific room."""
-    devices = []
+) -> list[DeviceSpec]:
+    """Resolve the device types and skills used by build_devices_for_room.
 
+    The result is the same for every room, so callers resolve it once and pass it to each
+    build_devices_for_room call instead of repeating the lookups per room.
+    """
+    specs = []
     for dt_name, device_names in DEVICE_NAMES.items():
-        # Skip room-independent devices
-        if dt_name in ("scene", "spotify_device"):
+        if dt_name in ROOMLESS_DEVICE_TYPES:
             continue
-
         device_type = device_types.get(dt_name)
-        skill_name = DEVICE_TYPE_SKILL_MAP.get(dt_name, "switch")
-        skill = skills.get(skill_name)
-
-        if not device_type or not skill:
-            continue
-
-        # Create one device of each name for this room
-        for device_name in device_names[:2]:  # Limit to 2 per type per room
-            device = GlobalDeviceFactory.build_with_attributes(
-                device_type_name=dt_name,
-                room_name=room.name,
-                name=device_name,
-                device_type_id=device_type.id,
-                room_id=room.id,
-                skill_id=skill.id,
-                pattern=[device_name.lower()],
-            )
-            devices.append(device)
-
-    return devices
+        skill = skills.get(DEVICE_TYPE_SKILL_MAP.get(dt_name, "switch"))
+        if device_type and skill:
+            specs.append((dt_name, device_type, skill, device_names[:2]))  # Limit to 2 per type per room
+    return specs
+
+
+def build_devices_for_room(room: Room, specs: list[DeviceSpec]) -> list[GlobalDevice]:
+    """Build devices for a specific room from specs resolved by resolve_room_device_specs."""
+    now = utcnow()
+    return [
+        make_device(
+            device_type_name=dt_name,
+            room_name=room.name,
+            name=device_name,
+            device_type_id=device_type.id,
+            room_id=room.id,
+            skill_id=skill.id,
+            now=now,
+        )
+        for dt_name, device_type, skill, device_names in specs
+        for device_name in device_names
+    ]
 
 
 def build_roomless_devices(
@@ -201,8 +252,9 @@ def build_roomless_devices(
 ) -> list[GlobalDevice]:
     """Build devices that don't belong to any room (scenes, spotify)."""
     devices = []
+    now = utcnow()
 
-    for dt_name in ("scene", "spotify_device"):
+    for dt_name in ROOMLESS_DEVICE_TYPES:
         device_type = device_types.get(dt_name)
         skill_name = DEVICE_TYPE_SKILL_MAP.get(dt_name, "switch")
         skill = skills.get(skill_name)
@@ -212,14 +264,14 @@ def build_roomless_devices(
 
         device_names = DEVICE_NAMES.get(dt_name, [])
         for device_name in device_names:
-            device = GlobalDeviceFactory.build_with_attributes(
+            device = make_device(
                 device_type_name=dt_name,
                 room_name=None,
                 name=device_name,
                 device_type_id=device_type.id,
                 room_id=None,
                 skill_id=skill.id,
-                pattern=[device_name.lower()],
+                now=now,
             )
             devices.append(device)
 
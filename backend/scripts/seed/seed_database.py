@@ -8,6 +8,7 @@ Usage:
     uv run python -m scripts.seed.seed_database           # Seed with defaults
     uv run python -m scripts.seed.seed_database --clean   # Clear existing data first
     uv run python -m scripts.seed.seed_database --dry-run # Preview without changes
+    uv run python -m scripts.seed.seed_database --bulk    # Load dependent tables with COPY
 """
 
 import argparse
@@ -15,66 +16,123 @@ import asyncio
 import contextlib
 import logging
 import sys
-from typing import TypeVar
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
 
+import orjson
 from private_assistant_commons.database.models import DeviceType, GlobalDevice, Room, Skill
 from private_assistant_picture_display_skill.models.device import DeviceDisplayState
 from private_assistant_picture_display_skill.models.image import Image
-from sqlalchemy import delete
-from sqlmodel import select
+from sqlalchemy import JSON, delete, func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import SQLModel, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.db import get_engine
 
 from .factories import (
-    DeviceDisplayStateFactory,
     build_all_device_types,
     build_all_images,
     build_all_rooms,
     build_all_skills,
     build_devices_for_room,
     build_roomless_devices,
+    freeze_now,
+    resolve_room_device_specs,
+    utcnow,
 )
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-T = TypeVar("T")
-
-
-async def get_or_create(session: AsyncSession, model: type[T], name: str, instance: T) -> T:
-    """Get existing record by name or insert new one."""
-    statement = select(model).where(model.name == name)  # type: ignore[attr-defined]
-    result = await session.exec(statement)
-    existing = result.first()
-    if existing:
-        logger.debug(f"{model.__name__} '{name}' already exists")
-        return existing
-
-    session.add(instance)
-    await session.flush()
-    logger.debug(f"Created {model.__name__} '{name}'")
-    return instance
-
-
-async def check_existing_data(session: AsyncSession) -> dict[str, int]:
-    """Check for existing data in all tables."""
-    counts: dict[str, int] = {}
-    for model, name in [
-        (Room, "rooms"),
-        (DeviceType, "device_types"),
-        (Skill, "skills"),
-        (GlobalDevice, "global_devices"),
-        (Image, "images"),
-        (DeviceDisplayState, "device_display_states"),
-    ]:
-        try:
-            result = await session.exec(select(model))  # type: ignore[arg-type, var-annotated]
-            counts[name] = len(result.all())
-        except Exception:
-            # Table might not exist yet
-            counts[name] = 0
-    return counts
+
+async def bulk_upsert_by_name[M: SQLModel](session: AsyncSession, model: type[M], instances: list[M]) -> dict[str, M]:
+    """Insert instances whose name is not taken yet and return all of them keyed by name.
+
+    One INSERT ... ON CONFLICT (name) DO NOTHING relies on the unique name index, followed by
+    one SELECT for the persisted rows, so existing rows keep their ids.
+    """
+    if not instances:
+        return {}
+    name_column = model.name  # type: ignore[attr-defined]
+    await session.exec(
+        pg_insert(model)
+        .values([instance.model_dump() for instance in instances])
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    names = [instance.name for instance in instances]  # type: ignore[attr-defined]
+    result = await session.exec(select(model).where(name_column.in_(names)))
+    return {row.name: row for row in result.all()}  # type: ignore[attr-defined]
+
+
+async def insert_rows(
+    session: AsyncSession, model: type[SQLModel], rows: Sequence[dict[str, Any]], *, bulk: bool = False
+) -> None:
+    """Insert row dicts in one statement, or with COPY when bulk is set.
+
+    Columns missing from a row are left to the column default in the INSERT path and written
+    as NULL by COPY, so rows should carry every column that has a non-NULL default.
+
+    AIDEV-NOTE: COPY (asyncpg copy_records_to_table) avoids the per-parameter overhead of a
+    multi-row INSERT and pays off for large seed sets. It runs on the session's own connection,
+    so the rows are part of the same transaction and are committed or rolled back with it.
+    """
+    if not rows:
+        return
+    if not bulk:
+        await session.exec(insert(model).values(list(rows)))
+        return
+
+    table: Any = model.__table__  # type: ignore[attr-defined]
+    json_columns = {column.name for column in table.columns if isinstance(column.type, JSON)}
+    columns = [column.name for column in table.columns]
+    records = []
+    for row in rows:
+        values = dict(row)
+        # SQLAlchemy's asyncpg JSON codec expects text; encode here instead of per value in the driver
+        for name in json_columns:
+            if values.get(name) is not None:
+                values[name] = orjson.dumps(values[name]).decode()
+        records.append(tuple(values.get(name) for name in columns))
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+        table.name, records=records, columns=columns
+    )
+
+
+# Tables reported by check_existing_data, in dependency order
+_COUNTED_MODELS: tuple[tuple[type[SQLModel], str], ...] = (
+    (Room, "rooms"),
+    (DeviceType, "device_types"),
+    (Skill, "skills"),
+    (GlobalDevice, "global_devices"),
+    (Image, "images"),
+    (DeviceDisplayState, "device_display_states"),
+)
+
+
+async def _count_rows(model: type[SQLModel]) -> int:
+    """Count rows in a model's table on a dedicated connection, or 0 if the table is missing."""
+    try:
+        # AUTOCOMMIT: a single read needs no transaction, snapshot or session bookkeeping
+        async with get_engine().connect() as connection:
+            autocommit = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            return (await autocommit.execute(select(func.count()).select_from(model))).scalar_one()
+    except Exception:
+        # Table might not exist yet
+        return 0
+
+
+async def check_existing_data() -> dict[str, int]:
+    """Count rows in all seeded tables.
+
+    AIDEV-NOTE: The counts run concurrently, each on its own connection, because one connection
+    cannot run statements in parallel. They run in autocommit mode, outside any transaction, so
+    the pre-flight holds no snapshot and a missing table cannot abort another count.
+    """
+    counts = await asyncio.gather(*(_count_rows(model) for model, _ in _COUNTED_MODELS))
+    return {name: count for (_, name), count in zip(_COUNTED_MODELS, counts, strict=True)}
 
 
 async def clear_data(session: AsyncSession) -> None:
@@ -99,42 +157,24 @@ async def clear_data(session: AsyncSession) -> None:
 async def seed_rooms(session: AsyncSession) -> dict[str, Room]:
     """Seed Room table and return name->instance mapping."""
     logger.info("Seeding rooms...")
-    rooms = {}
-    built_rooms = build_all_rooms()
-
-    for room in built_rooms:
-        persisted = await get_or_create(session, Room, room.name, room)
-        rooms[room.name] = persisted
-
-    logger.info(f"Seeded {len(rooms)} rooms")
+    rooms = await bulk_upsert_by_name(session, Room, build_all_rooms())
+    logger.info("Seeded %s rooms", len(rooms))
     return rooms
 
 
 async def seed_device_types(session: AsyncSession) -> dict[str, DeviceType]:
     """Seed DeviceType table and return name->instance mapping."""
     logger.info("Seeding device types...")
-    device_types = {}
-    built_types = build_all_device_types()
-
-    for dt in built_types:
-        persisted = await get_or_create(session, DeviceType, dt.name, dt)
-        device_types[dt.name] = persisted
-
-    logger.info(f"Seeded {len(device_types)} device types")
+    device_types = await bulk_upsert_by_name(session, DeviceType, build_all_device_types())
+    logger.info("Seeded %s device types", len(device_types))
     return device_types
 
 
 async def seed_skills(session: AsyncSession) -> dict[str, Skill]:
     """Seed Skill table and return name->instance mapping."""
     logger.info("Seeding skills...")
-    skills = {}
-    built_skills = build_all_skills()
-
-    for skill in built_skills:
-        persisted = await get_or_create(session, Skill, skill.name, skill)
-        skills[skill.name] = persisted
-
-    logger.info(f"Seeded {len(skills)} skills")
+    skills = await bulk_upsert_by_name(session, Skill, build_all_skills())
+    logger.info("Seeded %s skills", len(skills))
     return skills
 
 
@@ -143,74 +183,71 @@ async def seed_global_devices(
     rooms: dict[str, Room],
     device_types: dict[str, DeviceType],
     skills: dict[str, Skill],
+    *,
+    bulk: bool = False,
 ) -> list[GlobalDevice]:
-    """Seed GlobalDevice table with realistic device configurations."""
+    """Seed GlobalDevice table with realistic device configurations.
+
+    AIDEV-NOTE: Existing devices are matched by (name, device_type_id, room_id) against one
+    key-and-id query; missing ones go in with a single multi-row INSERT. global_devices has no
+    unique constraint on that key, so ON CONFLICT cannot be used and the pre-query is what keeps
+    seeding idempotent.
+
+    Returns:
+        The seeded devices, with ids resolved to the persisted rows. For devices that already
+        existed, only the id is taken from the database; the other fields are not reloaded.
+    """
     logger.info("Seeding global devices...")
-    devices = []
-
-    # Build devices for each room
-    for room in rooms.values():
-        room_devices = build_devices_for_room(room, device_types, skills)
-        for device in room_devices:
-            # Check if device already exists (by name + room + device_type)
-            statement = select(GlobalDevice).where(
-                GlobalDevice.name == device.name,
-                GlobalDevice.device_type_id == device.device_type_id,
-                GlobalDevice.room_id == device.room_id,
-            )
-            result = await session.exec(statement)
-            existing = result.first()
-            if existing:
-                devices.append(existing)
-                continue
-
-            session.add(device)
-            await session.flush()
-            devices.append(device)
-
-    # Build roomless devices (scenes, spotify)
-    roomless_devices = build_roomless_devices(device_types, skills)
-    for device in roomless_devices:
-        statement = select(GlobalDevice).where(
-            GlobalDevice.name == device.name,
-            GlobalDevice.device_type_id == device.device_type_id,
-            GlobalDevice.room_id == None,  # noqa: E711 - SQLAlchemy requires == for IS NULL
+    result = await session.exec(
+        select(
+            col(GlobalDevice.name), col(GlobalDevice.device_type_id), col(GlobalDevice.room_id), col(GlobalDevice.id)
         )
-        result = await session.exec(statement)
-        existing = result.first()
-        if existing:
-            devices.append(existing)
+    )
+    existing_ids = {(name, device_type_id, room_id): device_id for name, device_type_id, room_id, device_id in result}
+
+    # Devices for each room, then roomless devices (scenes, spotify)
+    specs = resolve_room_device_specs(device_types, skills)
+    devices = [device for room in rooms.values() for device in build_devices_for_room(room, specs)]
+    devices += build_roomless_devices(device_types, skills)
+
+    new_devices: list[GlobalDevice] = []
+    for device in devices:
+        key = (device.name, device.device_type_id, device.room_id)
+        if key in existing_ids:
+            device.id = existing_ids[key]
             continue
+        # Also guards against duplicates within this batch
+        existing_ids[key] = device.id
+        new_devices.append(device)
 
-        session.add(device)
-        await session.flush()
-        devices.append(device)
+    await insert_rows(session, GlobalDevice, [device.model_dump() for device in new_devices], bulk=bulk)
 
-    logger.info(f"Seeded {len(devices)} global devices")
+    logger.info("Seeded %s global devices (%s new)", len(devices), len(new_devices))
     return devices
 
 
-async def seed_images(session: AsyncSession) -> list[Image]:
-    """Seed Image table with fictional images."""
-    logger.info("Seeding images...")
-    images = []
-    built_images = build_all_images()
-
-    for image in built_images:
-        # Check if image already exists by storage_path
-        statement = select(Image).where(Image.storage_path == image.storage_path)
-        result = await session.exec(statement)
-        existing = result.first()
+async def seed_images(session: AsyncSession, *, bulk: bool = False) -> list[Image]:
+    """Seed Image table with fictional images, skipping storage paths that already exist.
 
-        if existing:
-            images.append(existing)
+    Returns:
+        The seeded images, with ids resolved to the persisted rows
+    """
+    logger.info("Seeding images...")
+    result = await session.exec(select(col(Image.storage_path), col(Image.id)))
+    existing_ids = dict(result.all())
+
+    images = build_all_images()
+    new_images: list[Image] = []
+    for image in images:
+        if image.storage_path in existing_ids:
+            image.id = existing_ids[image.storage_path]
             continue
+        existing_ids[image.storage_path] = image.id
+        new_images.append(image)
 
-        session.add(image)
-        await session.flush()
-        images.append(image)
+    await insert_rows(session, Image, [image.model_dump() for image in new_images], bulk=bulk)
 
-    logger.info(f"Seeded {len(images)} images")
+    logger.info("Seeded %s images (%s new)", len(images), len(new_images))
     return images
 
 
@@ -218,83 +255,105 @@ async def seed_device_display_states(
     session: AsyncSession,
     devices: list[GlobalDevice],
     device_types: dict[str, DeviceType],
-) -> list[DeviceDisplayState]:
-    """Seed DeviceDisplayState for picture_display type devices."""
+) -> int:
+    """Seed DeviceDisplayState for picture_display type devices.
+
+    AIDEV-NOTE: global_device_id is the primary key, so the database skips existing states in a
+    single INSERT ... ON CONFLICT DO NOTHING; no existence query is needed. COPY cannot skip
+    conflicting rows, which is why this table is never loaded in bulk mode.
+
+    Returns:
+        Number of display states that were inserted
+    """
     logger.info("Seeding device display states...")
-    display_states: list[DeviceDisplayState] = []
 
     picture_display_type = device_types.get("picture_display")
     if not picture_display_type:
         logger.warning("No picture_display device type found, skipping display states")
-        return display_states
-
-    for device in devices:
-        if device.device_type_id != picture_display_type.id:
-            continue
+        return 0
+
+    now = utcnow()
+    new_rows = [
+        {"global_device_id": device.id, "is_online": True, "scheduled_next_at": now}
+        for device in devices
+        if device.device_type_id == picture_display_type.id
+    ]
+    if not new_rows:
+        return 0
+    result = await session.exec(
+        pg_insert(DeviceDisplayState)
+        .values(new_rows)
+        .on_conflict_do_nothing(index_elements=["global_device_id"])
+        .returning(col(DeviceDisplayState.global_device_id))
+    )
+    inserted = len(result.all())
 
-        # Check if display state already exists
-        statement = select(DeviceDisplayState).where(DeviceDisplayState.global_device_id == device.id)
-        result = await session.exec(statement)
-        existing = result.first()
+    logger.info("Seeded %s device display states (%s new)", len(new_rows), inserted)
+    return inserted
 
-        if existing:
-            display_states.append(existing)
-            continue
 
-        display_state = DeviceDisplayStateFactory.build(global_device_id=device.id)
-        session.add(display_state)
-        await session.flush()
-        display_states.append(display_state)
+async def _run_phase[T](phase: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    """Run one seed phase in its own session and commit it.
 
-    logger.info(f"Seeded {len(display_states)} device display states")
-    return display_states
+    AIDEV-NOTE: An AsyncSession cannot run statements concurrently, so phases that are gathered
+    each get a session of their own. expire_on_commit=False keeps the returned rows readable
+    after the commit, once the session is closed.
+    """
+    async with AsyncSession(get_engine(), expire_on_commit=False) as session:
+        result = await phase(session)
+        await session.commit()
+        return result
 
 
-async def seed_database_async(clean: bool = False, dry_run: bool = False) -> None:
+async def seed_database_async(clean: bool = False, dry_run: bool = False, bulk: bool = False) -> None:
     """Main async seeding function.
 
     Args:
         clean: If True, clear existing data before seeding
         dry_run: If True, preview changes without committing
+        bulk: If True, load devices and images with COPY instead of INSERT
     """
     logger.info("Starting database seeding...")
 
-    async with AsyncSession(get_engine()) as session:
-        # Check existing data
-        existing_counts = await check_existing_data(session)
-        logger.info(f"Existing data: {existing_counts}")
+    # Check existing data before any write transaction is opened
+    existing_counts = await check_existing_data()
+    logger.info("Existing data: %s", existing_counts)
 
-        if dry_run:
-            logger.info("DRY RUN - No changes will be made")
-            logger.info("Would seed: 8 rooms, 10 device types, 7 skills, ~40 devices, 3 images")
-            return
+    if dry_run:
+        logger.info("DRY RUN - No changes will be made")
+        logger.info("Would seed: 8 rooms, 10 device types, 7 skills, ~40 devices, 3 images")
+        return
 
+    async with AsyncSession(get_engine()) as session:
         if clean:
             await clear_data(session)
 
+        freeze_now()
+
         # Seed in dependency order
-        # 1. Independent tables first
-        rooms = await seed_rooms(session)
-        device_types = await seed_device_types(session)
-        skills = await seed_skills(session)
+        # 1. Independent tables first, concurrently and committed before anything refers to them
+        rooms, device_types, skills = await asyncio.gather(
+            _run_phase(seed_rooms), _run_phase(seed_device_types), _run_phase(seed_skills)
+        )
 
-        # 2. Dependent tables
-        devices = await seed_global_devices(session, rooms, device_types, skills)
-        await seed_images(session)
-        await seed_device_display_states(session, devices, device_types)
+        # 2. Dependent tables; images do not depend on devices and load alongside them
+        async with asyncio.TaskGroup() as phases:
+            phases.create_task(_run_phase(lambda images_session: seed_images(images_session, bulk=bulk)))
+            devices = await seed_global_devices(session, rooms, device_types, skills, bulk=bulk)
+            await seed_device_display_states(session, devices, device_types)
 
-        # Final commit
-        await session.commit()
+            # Final commit
+            await session.commit()
 
-        # Report final counts
-        final_counts = await check_existing_data(session)
-        logger.info(f"Final data counts: {final_counts}")
-        logger.info("Database seeding completed successfully!")
+    # Report final counts
+    final_counts = await check_existing_data()
+    logger.info("Final data counts: %s", final_counts)
+    logger.info("Database seeding completed successfully!")
 
 
-def seed_database(clean: bool = False, dry_run: bool = False) -> None:
+def seed_database(clean: bool = False, dry_run: bool = False, bulk: bool = False) -> None:
     """Synchronous wrapper for async seeding function."""
-    asyncio.run(seed_database_async(clean=clean, dry_run=dry_run))
+    asyncio.run(seed_database_async(clean=clean, dry_run=dry_run, bulk=bulk))
 
 
 def main() -> None:
@@ -310,13 +369,18 @@ def main() -> None:
         action="store_true",
         help="Preview changes without making them",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Load devices and images with COPY (faster for large seed sets)",
+    )
 
     args = parser.parse_args()
 
     try:
-        seed_database(clean=args.clean, dry_run=args.dry_run)
+        seed_database(clean=args.clean, dry_run=args.dry_run, bulk=args.bulk)
     except Exception as e:
-        logger.error(f"Seeding failed: {e}")
+        logger.error("Seeding failed: %s", e)
         sys.exit(1)
 
 
@@ -1,16 +1,50 @@
 """Pytest configuration and fixtures."""
 
 import os
+from collections.abc import Iterator
+from typing import Any
 
-# Set up test environment variables before any imports
-os.environ.setdefault("PROJECT_NAME", "Test Project")
-os.environ.setdefault("POSTGRES_HOST", "localhost")
-os.environ.setdefault("POSTGRES_PORT", "5432")
-os.environ.setdefault("POSTGRES_DB", "test_db")
-os.environ.setdefault("POSTGRES_USER", "test_user")
-os.environ.setdefault("POSTGRES_PASSWORD", "test_pass")
-os.environ.setdefault("FIRST_SUPERUSER", "test@example.com")
-os.environ.setdefault("FIRST_SUPERUSER_PASSWORD", "test_password")
-os.environ.setdefault("SECRET_KEY", "test_secret_key_for_testing_only")
-os.environ.setdefault("ENVIRONMENT", "local")
-os.environ.setdefault("DISABLE_OAUTH", "true")
+import pytest
+from fastapi.testclient import TestClient
+
+# Test environment defaults; variables already set in the environment take precedence
+_DEFAULTS: dict[str, str] = {
+    "PROJECT_NAME": "Test Project",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "test_db",
+    "POSTGRES_USER": "test_user",
+    "POSTGRES_PASSWORD": "test_pass",
+    "FIRST_SUPERUSER": "test@example.com",
+    "FIRST_SUPERUSER_PASSWORD": "test_password",
+    "SECRET_KEY": "test_secret_key_for_testing_only",
+    "ENVIRONMENT": "local",
+    "DISABLE_OAUTH": "true",
+}
+
+
+def pytest_configure() -> None:
+    """Apply environment defaults before test modules (and the app settings) are imported."""
+    for key, value in _DEFAULTS.items():
+        os.environ.setdefault(key, value)
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Provide one TestClient for the whole session, running app startup and shutdown once."""
+    from app.main import app  # noqa: PLC0415 - imported after pytest_configure sets the environment
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def dependency_overrides(client: TestClient) -> Iterator[dict[Any, Any]]:
+    """Override app dependencies for one test, with an active user signed in by default."""
+    from app.api.deps import get_current_user  # noqa: PLC0415 - imported after pytest_configure sets the environment
+    from app.models import User  # noqa: PLC0415
+
+    overrides = client.app.dependency_overrides  # type: ignore[attr-defined]
+    overrides[get_current_user] = lambda: User(email="user@example.com", is_active=True)
+    yield overrides
+    overrides.clear()
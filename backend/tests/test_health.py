@@ -5,8 +5,6 @@ from http import HTTPStatus
 
 from fastapi.testclient import TestClient
 
-from app.main import app
-
 
 def test_app_package_exists() -> None:
     """Verify app package can be found."""
@@ -20,9 +18,8 @@ def test_app_api_package_exists() -> None:
     assert spec is not None
 
 
-def test_health_check_endpoint() -> None:
+def test_health_check_endpoint(client: TestClient) -> None:
     """Verify health check endpoint returns correct response."""
-    client = TestClient(app)
     response = client.get("/health")
 
     assert response.status_code == HTTPStatus.OK
@@ -0,0 +1,67 @@
+"""Tests for ETag revalidation of image metadata."""
+
+import uuid
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from private_assistant_picture_display_skill.models.image import Image
+
+from app.api.routes.picture_display import get_image_or_404
+
+
+@pytest.fixture
+def image(dependency_overrides: dict[Any, Any]) -> Image:
+    """Serve one fixed image from the image lookup dependency."""
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    image = Image(
+        id=uuid.uuid4(),
+        source_name="manual",
+        storage_path="manual/etag.jpg",
+        title="ETag",
+        created_at=now,
+        updated_at=now,
+    )
+    dependency_overrides[get_image_or_404] = lambda: image
+    return image
+
+
+def _image_url(image: Image) -> str:
+    """Return the metadata URL of an image."""
+    return f"/api/v1/picture-display/images/{image.id}"
+
+
+def test_read_image_sets_cache_headers(client: TestClient, image: Image) -> None:
+    """Verify image reads carry an ETag and a private Cache-Control."""
+    response = client.get(_image_url(image))
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["id"] == str(image.id)
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"].startswith("private, max-age=")
+
+
+@pytest.mark.parametrize("template", ["{etag}", "W/{etag}", '"other", {etag}'], ids=["strong", "weak", "list"])
+def test_read_image_not_modified(client: TestClient, image: Image, template: str) -> None:
+    """Verify a matching If-None-Match is answered with an empty 304."""
+    etag = client.get(_image_url(image)).headers["etag"]
+
+    response = client.get(_image_url(image), headers={"If-None-Match": template.format(etag=etag)})
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_read_image_etag_changes_with_metadata(client: TestClient, image: Image) -> None:
+    """Verify a metadata change invalidates the ETag even when updated_at is unchanged."""
+    etag = client.get(_image_url(image)).headers["etag"]
+    image.title = "Renamed elsewhere"
+
+    response = client.get(_image_url(image), headers={"If-None-Match": etag})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["etag"] != etag
+    assert response.json()["title"] == "Renamed elsewhere"
@@ -0,0 +1,44 @@
+"""Tests for detecting uploaded image types from magic bytes."""
+
+import pytest
+
+from app.api.routes.picture_display import IMAGE_SNIFF_BYTES, _sniff_image_type
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00", "image/jpeg"),
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "image/png"),
+        (b"GIF87a\x01\x00\x01\x00", "image/gif"),
+        (b"GIF89a\x01\x00\x01\x00", "image/gif"),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"\x00\x00\x00\x18ftypheic\x00\x00\x00\x00", "image/heic"),
+        (b"\x00\x00\x00\x18ftypheix\x00\x00\x00\x00", "image/heic"),
+        (b"\x00\x00\x00\x18ftypmif1\x00\x00\x00\x00", "image/heic"),
+        (b"\x00\x00\x00\x1cftypavif\x00\x00\x00\x00", "image/avif"),
+        (b"II*\x00\x08\x00\x00\x00", "image/tiff"),
+        (b"MM\x00*\x00\x00\x00\x08", "image/tiff"),
+        (b"BM\x36\x00\x0c\x00\x00\x00", "image/bmp"),
+    ],
+)
+def test_sniff_image_type_detects_signature(head: bytes, expected: str) -> None:
+    """Verify each supported signature maps to its MIME type."""
+    assert _sniff_image_type(head[:IMAGE_SNIFF_BYTES]) == expected
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        b"",
+        b"%PDF-1.7\n%\xe2\xe3\xcf\xd3",
+        b"<svg xmlns='http://www.w3.org/2000/svg'>",
+        b"RIFF\x24\x00\x00\x00WAVEfmt ",
+        b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00",
+        b"\xff\xd8",
+    ],
+    ids=["empty", "pdf", "svg", "riff-wave", "mp4", "truncated-jpeg"],
+)
+def test_sniff_image_type_rejects_unknown_bytes(head: bytes) -> None:
+    """Verify bytes matching no supported signature are not accepted as an image."""
+    assert _sniff_image_type(head) is None
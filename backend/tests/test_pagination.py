@@ -0,0 +1,115 @@
+"""Tests for keyset cursors and image list pagination."""
+
+import base64
+import uuid
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from private_assistant_picture_display_skill.models.image import Image
+
+from app.api.deps import get_db
+from app.api.pagination import decode_cursor, encode_cursor
+
+IMAGES_URL = "/api/v1/picture-display/images/"
+
+
+class _StubResult:
+    """Result whose all() returns fixed rows."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+
+class _StubSession:
+    """Session that answers every statement with the same rows."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+
+    async def exec(self, *_args: Any, **_kwargs: Any) -> _StubResult:
+        return _StubResult(self._rows)
+
+
+def _make_images(count: int) -> list[Image]:
+    """Build images ordered newest first, as the list statement returns them."""
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    return [
+        Image(
+            id=uuid.uuid4(),
+            source_name="manual",
+            storage_path=f"manual/{i}.jpg",
+            created_at=now - timedelta(minutes=i),
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def test_cursor_round_trip() -> None:
+    """Verify decode_cursor returns the position encode_cursor was given."""
+    created_at = datetime(2026, 1, 1, 12, 30, 15, 123456)
+    row_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(b'["a", "list"]').decode(),
+        base64.urlsafe_b64encode(b'{"id": "3f1c7a1e-0000-4000-8000-000000000000"}').decode(),
+        base64.urlsafe_b64encode(b'{"created_at": "2026-01-01T12:00:00", "id": "not-a-uuid"}').decode(),
+        encode_cursor(datetime(2026, 1, 1, 12, 0, tzinfo=UTC), uuid.uuid4()),
+    ],
+    ids=["bad-base64", "bad-json", "not-an-object", "missing-key", "bad-uuid", "aware-datetime"],
+)
+def test_decode_cursor_rejects_invalid_input(cursor: str) -> None:
+    """Verify malformed cursors raise ValueError instead of reaching the query."""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_read_images_last_page_has_no_next_cursor(client: TestClient, dependency_overrides: dict[Any, Any]) -> None:
+    """Verify the last page reports has_more=false and no next_cursor."""
+    images = _make_images(2)
+    dependency_overrides[get_db] = lambda: _StubSession(images)
+
+    response = client.get(IMAGES_URL, params={"limit": 2, "with_count": False})
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert len(data["data"]) == len(images)
+    assert data["has_more"] is False
+    assert data["next_cursor"] is None
+
+
+def test_read_images_next_cursor_points_at_last_row(client: TestClient, dependency_overrides: dict[Any, Any]) -> None:
+    """Verify a full page links to the next one through its last row."""
+    # One row beyond the limit signals another page
+    images = _make_images(3)
+    dependency_overrides[get_db] = lambda: _StubSession(images)
+
+    response = client.get(IMAGES_URL, params={"limit": 2, "with_count": False})
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [item["id"] for item in data["data"]] == [str(image.id) for image in images[:2]]
+    assert data["has_more"] is True
+    assert decode_cursor(data["next_cursor"]) == (images[1].created_at, images[1].id)
+
+
+def test_read_images_rejects_invalid_cursor(client: TestClient, dependency_overrides: dict[Any, Any]) -> None:
+    """Verify a malformed cursor is a client error, not a server error."""
+    dependency_overrides[get_db] = lambda: _StubSession([])
+
+    response = client.get(IMAGES_URL, params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST